@@ -30,6 +30,15 @@ def setup_logging(level: str = "INFO", log_file: str = "yuga.log") -> None:
     logging.getLogger("aiohttp").setLevel(logging.WARNING)
 
 
+def use_fast_event_loop() -> None:
+    """Switch asyncio to uvloop when it is installed; the default loop is used otherwise."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Yuga - Polymarket Arbitrage Bot")
     parser.add_argument("--config", default="config.yaml", help="Path to config file")
@@ -43,6 +52,7 @@ def main() -> None:
     config = load_config(args.config)
 
     setup_logging(config.logging.level, config.logging.file)
+    use_fast_event_loop()
 
     from yuga.engine import Engine
     engine = Engine(config)
@@ -74,11 +84,11 @@ def _run_headless(engine) -> None:
             while True:
                 await asyncio.sleep(10)
                 state = engine.get_state()
-                stats = state["exec_stats"]
-                arb = state["arb_stats"]
+                stats = state.exec_stats
+                mm = state.mm_stats
                 logging.info(
-                    "Markets: %d | Signals: %d | Orders: %d | Fills: %d | PnL: $%.4f",
-                    arb["markets_tracked"], arb["active_signals"],
+                    "Markets: %d | Quotes: %d | Orders: %d | Fills: %d | PnL: $%.4f",
+                    mm["markets_tracked"], mm["active_quotes"],
                     stats["total_orders"], stats["total_fills"],
                     stats["cumulative_pnl"],
                 )
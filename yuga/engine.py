@@ -7,6 +7,9 @@ import json
 import logging
 import time
 from collections import defaultdict, deque
+from dataclasses import dataclass
+from itertools import islice
+from operator import attrgetter
 from typing import Any, Callable, Awaitable
 
 from yuga.config import AppConfig
@@ -20,6 +23,53 @@ from yuga.strategy.market_maker import MarketMakerEngine, MarketState
 logger = logging.getLogger("yuga.engine")
 
 
+@dataclass(slots=True)
+class MarketsSnapshot:
+    """Scanner rows as parallel columns, one entry per market."""
+    ids: list[str]
+    names: list[str]
+    yes_mid: list[float]
+    no_mid: list[float]
+    spread_bps: list[float]
+    ready: list[bool]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+@dataclass(slots=True)
+class EngineSnapshot:
+    """Point-in-time view of engine state for the TUI."""
+    running: bool
+    paused: bool
+    uptime_s: float
+    pipeline_stage: str
+    mm_stats: dict[str, Any]
+    exec_stats: dict[str, Any]
+    risk_status: dict[str, Any]
+    ws_state: dict[str, Any]
+    clob_latency_ms: float
+    active_quotes: dict[str, dict[str, Any]]
+    recent_orders: list[dict[str, Any]]
+    markets: MarketsSnapshot
+    orderbook_view: dict[str, Any]
+    odds_view: dict[str, Any]
+    inventory: list[dict[str, Any]]
+    pnl_history: list[tuple[float, float]]
+    revs: dict[str, int]
+
+
+@dataclass(slots=True)
+class ClockSnapshot:
+    """Fields that age with the clock, for the TUI's once-a-second redraw."""
+    paused: bool
+    uptime_s: float
+    ws_state: dict[str, Any]
+    clob_latency_ms: float
+    recent_orders: list[dict[str, Any]]
+    orders_rev: int
+
+
 class Engine:
     """Main bot engine orchestrating all subsystems."""
 
@@ -57,6 +107,8 @@ class Engine:
         self._scan_task: asyncio.Task | None = None
         self._discovery_task: asyncio.Task | None = None
         self._event_listeners: list[Callable[[str, Any], Awaitable[None]]] = []
+        # Set whenever displayable state may have changed; the TUI waits on it to redraw.
+        self.state_dirty = asyncio.Event()
         self._start_time = 0.0
         self._log_buffer: list[dict] = []
         self._ob_selected_condition_id = ""
@@ -67,11 +119,15 @@ class Engine:
         self._odds_history: dict[str, deque[tuple[float, float, float]]] = defaultdict(
             lambda: deque(maxlen=240)
         )
+        self._odds_rev = 0
+        # get_state() sections keyed by the revision they were built from.
+        self._state_cache: dict[str, tuple[int, Any]] = {}
 
     def add_event_listener(self, cb: Callable[[str, Any], Awaitable[None]]) -> None:
         self._event_listeners.append(cb)
 
     async def _emit(self, event: str, data: Any = None) -> None:
+        self.state_dirty.set()
         for cb in self._event_listeners:
             try:
                 await cb(event, data)
@@ -83,6 +139,7 @@ class Engine:
         self._start_time = time.time()
         await self.db.connect()
         await self.executor.load_positions()
+        await self.risk.reconcile_open_orders(time.time())
         await self.clob.start()
         await self.ws.start()
         self._running = True
@@ -165,13 +222,16 @@ class Engine:
             current_idx = 0
         next_idx = (current_idx + step) % len(available)
         self._set_orderbook_selected(available[next_idx])
+        self.state_dirty.set()
         return True
 
     def set_orderbook_auto_rotate(self, enabled: bool) -> None:
         self._ob_auto_rotate = enabled
+        self.state_dirty.set()
 
     def toggle_orderbook_auto_rotate(self) -> bool:
         self._ob_auto_rotate = not self._ob_auto_rotate
+        self.state_dirty.set()
         return self._ob_auto_rotate
 
     # -- Market Discovery --
@@ -292,8 +352,8 @@ class Engine:
         if "sells" in update:
             book_data["asks"] = update["sells"]
 
-        if book_data:
-            self.mm.update_book(asset_id, book_data)
+        if book_data and self.mm.update_book(asset_id, book_data) is not None:
+            self.state_dirty.set()
 
     # -- Strategy Scan Loop --
 
@@ -302,8 +362,12 @@ class Engine:
         interval = self.config.strategy.scan_interval_ms / 1000
         while self._running:
             try:
+                revs = self._revisions()
+                cb_active = self.risk.circuit_breaker.is_active
                 # Keep book backfill running even while quoting is paused.
                 await self._refresh_stale_books()
+                self.risk.tick(time.time())
+                await self.risk.reconcile_open_orders(time.time())
                 if not self.executor.paused:
                     self.executor.pipeline_stage = PipelineStage.SCANNING
                     signals = self.mm.generate_quotes(
@@ -315,6 +379,11 @@ class Engine:
                         await self.executor.sync_quotes(signals)
                     await self.executor.refresh_open_orders()
                     self.executor.pipeline_stage = PipelineStage.IDLE
+                # Wake the TUI only if the pass changed something; a running breaker
+                # counts, so its countdown and expiry still reach the risk panel.
+                if (self._revisions() != revs or cb_active
+                        or self.risk.circuit_breaker.is_active):
+                    self.state_dirty.set()
 
             except asyncio.CancelledError:
                 break
@@ -324,6 +393,9 @@ class Engine:
 
             await asyncio.sleep(interval)
 
+    def _revisions(self) -> tuple[int, int, int]:
+        return (self.mm.revision, self.executor.revision, self.risk.revision)
+
     async def _refresh_stale_books(self) -> None:
         """Backfill books via REST when WS updates lag to keep UI/strategy fed."""
         now = time.time()
@@ -373,22 +445,40 @@ class Engine:
     def recent_logs(self) -> list[dict]:
         return list(self._log_buffer[-100:])
 
-    def _capture_odds_samples(self) -> None:
-        now = time.time()
+    def _sweep_markets(self, now: float) -> tuple[list[MarketState], list[MarketState]]:
+        """One pass over tracked markets for the TUI snapshot.
+
+        Captures odds samples and returns (ready, available) markets sorted by
+        condition_id, so get_state() walks the market dict once instead of per consumer.
+        """
+        max_age_s = self.config.strategy.price_staleness_ms / 1000
+        ready: list[MarketState] = []
+        available: list[MarketState] = []
         for m in self.mm.markets.values():
-            if not m.yes_book or not m.no_book:
+            yes_book, no_book = m.yes_book, m.no_book
+            if yes_book is None or no_book is None:
                 continue
-            yes_mid = float(m.yes_book.mid)
-            no_mid = float(m.no_book.mid)
+            available.append(m)
+            if now - yes_book.timestamp <= max_age_s and now - no_book.timestamp <= max_age_s:
+                ready.append(m)
+            yes_mid = float(yes_book.mid)
+            no_mid = float(no_book.mid)
             if yes_mid <= 0 or no_mid <= 0:
                 continue
             hist = self._odds_history[m.condition_id]
             if not hist:
                 hist.append((now, yes_mid, no_mid))
+                self._odds_rev += 1
                 continue
             last_ts, last_yes, last_no = hist[-1]
             if (now - last_ts) >= 1.0 or abs(yes_mid - last_yes) >= 0.0005 or abs(no_mid - last_no) >= 0.0005:
                 hist.append((now, yes_mid, no_mid))
+                self._odds_rev += 1
+
+        by_condition = attrgetter("condition_id")
+        ready.sort(key=by_condition)
+        available.sort(key=by_condition)
+        return ready, available
 
     def _odds_view_from_orderbook(self, ob_view: dict[str, Any]) -> dict[str, Any]:
         condition_id = ob_view.get("condition_id", "")
@@ -427,29 +517,30 @@ class Engine:
 
     # -- State Snapshot for TUI --
 
-    def get_state(self) -> dict[str, Any]:
+    def _cached_section(self, name: str, rev: int, build: Callable[[], Any]) -> Any:
+        """Reuse a snapshot section until its source revision moves."""
+        hit = self._state_cache.get(name)
+        if hit is not None and hit[0] == rev:
+            return hit[1]
+        value = build()
+        self._state_cache[name] = (rev, value)
+        return value
+
+    def get_state(self) -> EngineSnapshot:
         """Return full state snapshot for TUI rendering."""
-        self._capture_odds_samples()
-        ob_view = self._orderbook_view()
-        return {
-            "running": self._running,
-            "paused": self.executor.paused,
-            "uptime_s": time.time() - self._start_time if self._start_time else 0,
-            "pipeline_stage": self.executor.pipeline_stage.value,
-            "mm_stats": self.mm.stats,
-            "exec_stats": self.executor.stats,
-            "risk_status": self.risk.status,
-            "ws_state": {
-                "connected": self.ws.state.connected,
-                "latency_ms": self.ws.state.latency_ms,
-                "reconnects": self.ws.state.reconnect_count,
-                "subscribed": len(self.ws.state.subscribed_assets),
-                "error": self.ws.state.error,
-                "last_msg_age_s": (time.time() - self.ws.state.last_message_at
-                                   if self.ws.state.last_message_at else 0),
-            },
-            "clob_latency_ms": self.clob.last_latency_ms,
-            "active_quotes": {
+        ready, available = self._sweep_markets(time.time())
+        ob_view = self._orderbook_view(ready, available)
+        return EngineSnapshot(
+            running=self._running,
+            paused=self.executor.paused,
+            uptime_s=time.time() - self._start_time if self._start_time else 0,
+            pipeline_stage=self.executor.pipeline_stage.value,
+            mm_stats=self.mm.stats,
+            exec_stats=self.executor.stats,
+            risk_status=self.risk.status,
+            ws_state=self._ws_view(time.time()),
+            clob_latency_ms=self.clob.last_latency_ms,
+            active_quotes=self._cached_section("active_quotes", self.mm.revision, lambda: {
                 cid[:8]: {
                     "market": s.market_id,
                     "spread_bps": s.spread_bps,
@@ -458,46 +549,77 @@ class Engine:
                     "max_size": s.max_size,
                 }
                 for cid, s in self.mm.active_quotes.items()
+            }),
+            recent_orders=self._recent_orders_view(time.time()),
+            markets=self._markets_snapshot(ready),
+            orderbook_view=ob_view,
+            odds_view=self._odds_view_from_orderbook(ob_view),
+            inventory=self._cached_section(
+                "inventory", self.executor.revision, self.executor.inventory_summary
+            ),
+            pnl_history=self._cached_section(
+                "pnl_history", self.executor.revision, lambda: self.executor.recent_pnl(100)
+            ),
+            # Change counters per state source; the TUI skips widgets whose inputs are unchanged.
+            revs={
+                "markets": self.mm.revision,
+                "orders": self.executor.revision,
+                "risk": self.risk.revision,
+                "odds": self._odds_rev,
             },
-            "recent_orders": [
-                {
-                    "id": o.id[:8], "side": o.side, "outcome": o.outcome,
-                    "price": o.price, "size": o.size, "filled": o.filled_size,
-                    "status": o.status, "latency_ms": o.latency_ms,
-                    "age_s": time.time() - o.created_at,
-                }
-                for o in self.executor.recent_orders[-30:]
-            ],
-            "markets": [
-                {
-                    "id": m.condition_id[:8],
-                    "question": m.question[:50],
-                    "yes_bid": m.yes_book.best_bid if m.yes_book else 0,
-                    "yes_ask": m.yes_book.best_ask if m.yes_book else 0,
-                    "no_bid": m.no_book.best_bid if m.no_book else 0,
-                    "no_ask": m.no_book.best_ask if m.no_book else 0,
-                    "yes_mid": m.yes_book.mid if m.yes_book else 0,
-                    "no_mid": m.no_book.mid if m.no_book else 0,
-                    "spread_bps": (m.yes_book.spread_bps if m.yes_book else 0),
-                    "ready": m.is_ready(self.config.strategy.price_staleness_ms),
-                }
-                for m in list(self.mm.markets.values())[:20]
-            ],
-            "orderbook_view": ob_view,
-            "odds_view": self._odds_view_from_orderbook(ob_view),
-            "inventory": self.executor.inventory_summary(),
-            "pnl_history": self.executor.pnl_history[-100:],
-        }
+        )
 
-    def _orderbook_view(self) -> dict[str, Any]:
+    def get_clock_state(self) -> ClockSnapshot:
+        """Clock-driven fields only; no market sweeps, cheap enough to poll every second."""
         now = time.time()
-        dwell_s = max(1.0, float(self.config.strategy.orderbook_dwell_s))
-        ready = [
-            m for m in self.mm.markets.values()
-            if m.is_ready(self.config.strategy.price_staleness_ms)
+        return ClockSnapshot(
+            paused=self.executor.paused,
+            uptime_s=now - self._start_time if self._start_time else 0,
+            ws_state=self._ws_view(now),
+            clob_latency_ms=self.clob.last_latency_ms,
+            recent_orders=self._recent_orders_view(now),
+            orders_rev=self.executor.revision,
+        )
+
+    def _ws_view(self, now: float) -> dict[str, Any]:
+        ws = self.ws.state
+        return {
+            "connected": ws.connected,
+            "latency_ms": ws.latency_ms,
+            "reconnects": ws.reconnect_count,
+            "subscribed": len(ws.subscribed_assets),
+            "error": ws.error,
+            "last_msg_age_s": now - ws.last_message_at if ws.last_message_at else 0,
+        }
+
+    def _recent_orders_view(self, now: float) -> list[dict[str, Any]]:
+        return [
+            {
+                "id": o.id[:8], "side": o.side, "outcome": o.outcome,
+                "price": o.price, "size": o.size, "filled": o.filled_size,
+                "status": o.status, "latency_ms": o.latency_ms,
+                "age_s": now - o.created_at,
+            }
+            for o in self.executor.recent_orders[-30:]
         ]
-        available = self._available_orderbook_markets()
-        ready.sort(key=lambda m: m.condition_id)
+
+    def _markets_snapshot(self, ready: list[MarketState]) -> MarketsSnapshot:
+        ready_ids = {m.condition_id for m in ready}
+        snap = MarketsSnapshot([], [], [], [], [], [])
+        for m in islice(self.mm.markets.values(), 20):
+            yes_book, no_book = m.yes_book, m.no_book
+            snap.ids.append(m.condition_id[:8])
+            snap.names.append(m.display_name)
+            snap.yes_mid.append(yes_book.mid if yes_book else 0)
+            snap.no_mid.append(no_book.mid if no_book else 0)
+            snap.spread_bps.append(yes_book.spread_bps if yes_book else 0)
+            snap.ready.append(m.condition_id in ready_ids)
+        return snap
+
+    def _orderbook_view(
+        self, ready: list[MarketState], available: list[MarketState]
+    ) -> dict[str, Any]:
+        now = time.time()
         if available:
             selected: MarketState | None = next(
                 (m for m in available if m.condition_id == self._ob_selected_condition_id),
@@ -545,10 +667,10 @@ class Engine:
                 "question": selected.question,
                 "yes_mid": selected.yes_book.mid if selected.yes_book else 0.0,
                 "no_mid": selected.no_book.mid if selected.no_book else 0.0,
-                "yes_bids": (selected.yes_book.bids[:5] if selected.yes_book else []),
-                "yes_asks": (selected.yes_book.asks[:5] if selected.yes_book else []),
-                "no_bids": (selected.no_book.bids[:5] if selected.no_book else []),
-                "no_asks": (selected.no_book.asks[:5] if selected.no_book else []),
+                "yes_bids": (selected.yes_book.top_bids(5) if selected.yes_book else []),
+                "yes_asks": (selected.yes_book.top_asks(5) if selected.yes_book else []),
+                "no_bids": (selected.no_book.top_bids(5) if selected.no_book else []),
+                "no_asks": (selected.no_book.top_asks(5) if selected.no_book else []),
                 "quotes": quotes,
                 "rotate_in_s": (
                     max(0.0, self._ob_selected_until - now) if self._ob_auto_rotate else 0.0
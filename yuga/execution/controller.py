@@ -5,8 +5,10 @@ from __future__ import annotations
 import logging
 import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import islice
 from typing import Any
 
 from yuga.db import Database
@@ -70,12 +72,15 @@ class ExecutionController:
         self._total_rejects = 0
         self._total_cancels = 0
         self._cumulative_latency = 0.0
-        self._pnl_history: list[tuple[float, float]] = []  # (timestamp, cumulative_pnl)
+        # (timestamp, cumulative_pnl); bounded ring so long sessions don't grow without limit.
+        self._pnl_history: deque[tuple[float, float]] = deque(maxlen=4096)
         self._cumulative_pnl = 0.0
         self._spread_capture_pnl = 0.0
         self._liquidity_rewards = 0.0
         self._positions: dict[tuple[str, str], dict[str, float | str]] = {}
         self._last_refresh = 0.0
+        # Bumped on any order, fill, or position change; lets the TUI skip idle redraws.
+        self.revision = 0
 
     async def sync_quotes(self, signals: list[QuoteSignal]) -> None:
         """Cancel/replace quotes to match desired signals."""
@@ -147,6 +152,7 @@ class ExecutionController:
                 "avg_price": float(row["avg_price"]),
                 "market_id": row.get("market_id", ""),
             }
+        self.revision += 1
 
     def _quote_key(self, condition_id: str, token_id: str, side: str) -> str:
         return f"{condition_id}:{token_id}:{side}"
@@ -168,8 +174,11 @@ class ExecutionController:
     async def _cancel_order(self, order: OrderRecord) -> None:
         try:
             await self.clob.cancel_order(order.id)
+            if order.status in ("PENDING", "OPEN", "PARTIAL"):
+                self.risk.on_order_close()
             order.status = "CANCELLED"
             self._total_cancels += 1
+            self.revision += 1
             await self.db.update_order_status(order.id, "CANCELLED", order.filled_size)
             await self.db.insert_quote_event({
                 "order_id": order.id,
@@ -210,6 +219,7 @@ class ExecutionController:
                 record.id = resp.get("orderID", order_id)
                 record.status = "OPEN"
                 self._total_orders += 1
+                self.risk.on_order_open()
                 logger.info("Order placed: %s %s %s @ %.4f x %.1f (%.0fms)",
                            side, outcome, token_id[:8], price, size, record.latency_ms)
             else:
@@ -226,6 +236,7 @@ class ExecutionController:
         self.recent_orders.append(record)
         if len(self.recent_orders) > 200:
             self.recent_orders = self.recent_orders[-200:]
+        self.revision += 1
 
         await self.db.insert_order({
             "id": record.id, "market_id": market_id, "condition_id": condition_id,
@@ -280,6 +291,7 @@ class ExecutionController:
 
     async def record_rebate(self, market_id: str, amount_usdc: float) -> None:
         self._liquidity_rewards += amount_usdc
+        self.revision += 1
         await self.db.insert_rebate({
             "market_id": market_id,
             "amount_usdc": amount_usdc,
@@ -312,18 +324,23 @@ class ExecutionController:
                     order.status = "FILLED"
                     order.filled_size = order.size
                     self._total_fills += 1
+                    self.risk.on_order_close()
                     if delta > 0:
                         await self._apply_fill(order, delta)
                     self.active_quotes.pop(key, None)
+                    self.revision += 1
                 elif filled > 0:
                     order.status = "PARTIAL"
                     order.filled_size = filled
                     if delta > 0:
                         await self._apply_fill(order, delta, partial=True)
+                    self.revision += 1
                 elif status in ("CANCELLED", "EXPIRED"):
                     order.status = "CANCELLED"
                     self._total_cancels += 1
+                    self.risk.on_order_close()
                     self.active_quotes.pop(key, None)
+                    self.revision += 1
 
                 await self.db.update_order_status(order.id, order.status, order.filled_size)
             except Exception as e:
@@ -351,6 +368,7 @@ class ExecutionController:
         pos["size"] = new_size
         pos["avg_price"] = avg_price
         self._positions[key] = pos
+        self.revision += 1
 
         pnl = filled * order.price * (1 if order.side == "SELL" else -1)
         self._cumulative_pnl += pnl
@@ -387,8 +405,10 @@ class ExecutionController:
             for order in self.recent_orders:
                 if order.status in ("OPEN", "PENDING"):
                     order.status = "CANCELLED"
+                    self.risk.on_order_close()
                     cancelled += 1
             self.active_quotes.clear()
+            self.revision += 1
             return cancelled
         except Exception as e:
             logger.error("Cancel all failed: %s", e)
@@ -417,3 +437,9 @@ class ExecutionController:
     @property
     def pnl_history(self) -> list[tuple[float, float]]:
         return list(self._pnl_history)
+
+    def recent_pnl(self, n: int) -> list[tuple[float, float]]:
+        """Return the last n PnL samples (oldest first) without copying the whole ring."""
+        tail = list(islice(reversed(self._pnl_history), n))
+        tail.reverse()
+        return tail
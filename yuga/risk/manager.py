@@ -51,25 +51,59 @@ class RiskManager:
         self._total_checks = 0
         self._total_rejections = 0
         self._rejection_reasons: dict[str, int] = {}
+        # Bumped whenever displayed risk state changes; lets the TUI skip idle redraws.
+        self.revision = 0
+        # Cached gate flags: refreshed by tick() and on state changes, read by check_signal.
+        self._cb_active = False
+        self._daily_pnl_ok = True
+        self._consec_ok = True
+        self._last_tick = 0.0
+        # Live PENDING/OPEN/PARTIAL order count, kept by the executor's open/close callbacks.
+        self._open_order_count = 0
+        self._last_reconcile = 0.0
+
+    def tick(self, now: float) -> None:
+        """Refresh time-dependent gates (breaker cooldown, daily reset); call once per loop."""
+        if now - self._last_tick < 0.1:
+            return
+        self._last_tick = now
+        self._maybe_reset_daily()
+        self._cb_active = self.circuit_breaker.is_active
+
+    def on_order_open(self) -> None:
+        self._open_order_count += 1
+
+    def on_order_close(self) -> None:
+        self._open_order_count = max(0, self._open_order_count - 1)
+
+    async def reconcile_open_orders(self, now: float, interval_s: float = 60.0) -> None:
+        """Resync the cached open-order count against the DB, at most once per interval."""
+        if now - self._last_reconcile < interval_s:
+            return
+        self._last_reconcile = now
+        count = len(await self.db.get_open_orders())
+        if count != self._open_order_count:
+            logger.debug("Open order count drift: cached %d, db %d",
+                         self._open_order_count, count)
+            self._open_order_count = count
 
     async def check_signal(self, signal: QuoteSignal) -> tuple[bool, str]:
         """Validate whether a quote should be executed given current risk state."""
         self._total_checks += 1
 
         # Circuit breaker
-        if self.circuit_breaker.is_active:
+        if self._cb_active:
             return self._reject("CIRCUIT_BREAKER",
                                 f"Circuit breaker active: {self.circuit_breaker.reason} "
                                 f"({self.circuit_breaker.remaining_s:.0f}s remaining)")
 
         # Daily loss limit
-        self._maybe_reset_daily()
-        if self._daily_pnl <= -self.config.max_daily_loss_usdc:
+        if not self._daily_pnl_ok:
             self._trip_circuit_breaker("Daily loss limit exceeded")
             return self._reject("DAILY_LOSS", f"Daily PnL {self._daily_pnl:.2f} exceeds limit")
 
         # Consecutive losses
-        if self._consecutive_losses >= self.config.max_consecutive_losses:
+        if not self._consec_ok:
             self._trip_circuit_breaker(f"{self._consecutive_losses} consecutive losses")
             return self._reject("CONSEC_LOSSES",
                                 f"{self._consecutive_losses} consecutive losses")
@@ -100,9 +134,8 @@ class RiskManager:
                 )
 
         # Open orders limit
-        open_orders = await self.db.get_open_orders()
-        if len(open_orders) >= self.config.max_open_orders:
-            return self._reject("MAX_ORDERS", f"Open orders at limit: {len(open_orders)}")
+        if self._open_order_count >= self.config.max_open_orders:
+            return self._reject("MAX_ORDERS", f"Open orders at limit: {self._open_order_count}")
 
         return True, "OK"
 
@@ -110,12 +143,14 @@ class RiskManager:
         """Record the result of a quote cycle for risk tracking."""
         self._maybe_reset_daily()
         self._daily_pnl += pnl
+        self.revision += 1
         await self.db.set_metric("daily_pnl", self._daily_pnl)
 
         if pnl < 0:
             self._consecutive_losses += 1
         else:
             self._consecutive_losses = 0
+        self._refresh_limits()
 
         await self.db.set_metric("consecutive_losses", self._consecutive_losses)
 
@@ -123,17 +158,22 @@ class RiskManager:
         """Manually reset the circuit breaker."""
         self.circuit_breaker.triggered = False
         self.circuit_breaker.reason = ""
+        self._cb_active = False
+        self.revision += 1
         logger.info("Circuit breaker manually reset")
 
     def _trip_circuit_breaker(self, reason: str) -> None:
         self.circuit_breaker.triggered = True
         self.circuit_breaker.triggered_at = time.time()
         self.circuit_breaker.reason = reason
+        self._cb_active = True
+        self.revision += 1
         logger.warning("CIRCUIT BREAKER TRIPPED: %s", reason)
 
     def _reject(self, code: str, reason: str) -> tuple[bool, str]:
         self._total_rejections += 1
         self._rejection_reasons[code] = self._rejection_reasons.get(code, 0) + 1
+        self.revision += 1
         logger.info("Risk rejection [%s]: %s", code, reason)
         return False, reason
 
@@ -143,6 +183,12 @@ class RiskManager:
             self._daily_pnl = 0
             self._daily_reset_date = today
             self._consecutive_losses = 0
+            self._refresh_limits()
+            self.revision += 1
+
+    def _refresh_limits(self) -> None:
+        self._daily_pnl_ok = self._daily_pnl > -self.config.max_daily_loss_usdc
+        self._consec_ok = self._consecutive_losses < self.config.max_consecutive_losses
 
     @property
     def status(self) -> dict[str, Any]:
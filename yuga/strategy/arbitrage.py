@@ -16,51 +16,19 @@ import uuid
 from dataclasses import dataclass, field
 from typing import Any
 
-logger = logging.getLogger("yuga.strategy.arb")
-
-
-@dataclass
-class OrderBookSnapshot:
-    token_id: str
-    outcome: str  # YES or NO
-    bids: list[tuple[float, float]]  # [(price, size), ...] sorted desc
-    asks: list[tuple[float, float]]  # [(price, size), ...] sorted asc
-    timestamp: float = field(default_factory=time.time)
-
-    @property
-    def best_bid(self) -> float:
-        return self.bids[0][0] if self.bids else 0
-
-    @property
-    def best_ask(self) -> float:
-        return self.asks[0][0] if self.asks else 1.0
-
-    @property
-    def best_bid_size(self) -> float:
-        return self.bids[0][1] if self.bids else 0
+from yuga.strategy.common import BookSnapshot, MarketIndex, parse_levels
 
-    @property
-    def best_ask_size(self) -> float:
-        return self.asks[0][1] if self.asks else 0
-
-    @property
-    def mid(self) -> float:
-        if self.bids and self.asks:
-            return (self.best_bid + self.best_ask) / 2
-        return self.best_bid or self.best_ask
+logger = logging.getLogger("yuga.strategy.arb")
 
-    @property
-    def spread_bps(self) -> float:
-        if self.best_bid > 0:
-            return (self.best_ask - self.best_bid) / self.best_bid * 10000
-        return 0
 
+@dataclass(slots=True)
+class OrderBookSnapshot(BookSnapshot):
     @property
     def is_stale(self) -> bool:
         return (time.time() - self.timestamp) > 2.0  # 2s staleness
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketState:
     market_id: str
     condition_id: str
@@ -74,15 +42,15 @@ class MarketState:
 
     @property
     def is_ready(self) -> bool:
-        return (
-            self.yes_book is not None
-            and self.no_book is not None
-            and not self.yes_book.is_stale
-            and not self.no_book.is_stale
-        )
+        yes_book, no_book = self.yes_book, self.no_book
+        if yes_book is None or no_book is None:
+            return False
+        # One clock read for both sides; equivalent to two is_stale checks.
+        cutoff = time.time() - 2.0
+        return yes_book.timestamp >= cutoff and no_book.timestamp >= cutoff
 
 
-@dataclass
+@dataclass(slots=True)
 class ArbSignal:
     id: str
     market_id: str
@@ -112,6 +80,7 @@ class ArbitrageEngine:
         self.min_spread_bps = min_spread_bps
         self.min_liquidity = min_liquidity
         self.markets: dict[str, MarketState] = {}
+        self._index: MarketIndex[MarketState] = MarketIndex()
         self.active_signals: dict[str, ArbSignal] = {}
         self._scan_count = 0
         self._signal_count = 0
@@ -119,46 +88,42 @@ class ArbitrageEngine:
 
     def add_market(self, market: MarketState) -> None:
         self.markets[market.condition_id] = market
+        self._index.add(market)
 
     def remove_market(self, condition_id: str) -> None:
         self.markets.pop(condition_id, None)
+        self._index.remove(condition_id)
         self.active_signals.pop(condition_id, None)
 
     def update_book(self, token_id: str, book_data: dict) -> OrderBookSnapshot | None:
         """Update order book for a token and return snapshot."""
-        bids = [(float(b["price"]), float(b["size"])) for b in book_data.get("bids", [])]
-        asks = [(float(a["price"]), float(a["size"])) for a in book_data.get("asks", [])]
-        bids.sort(key=lambda x: x[0], reverse=True)
-        asks.sort(key=lambda x: x[0])
-
+        # Find which market this token belongs to
+        entry = self._index.lookup(token_id)
+        if entry is None:
+            return None
+        mkt, outcome = entry
+        bids = parse_levels(book_data.get("bids", ()))
+        asks = parse_levels(book_data.get("asks", ()))
         snapshot = OrderBookSnapshot(
             token_id=token_id,
-            outcome="",  # Set by caller
+            outcome=outcome,
             bids=bids,
             asks=asks,
             timestamp=time.time(),
         )
-
-        # Find which market this token belongs to
-        for mkt in self.markets.values():
-            if mkt.yes_token_id == token_id:
-                snapshot.outcome = "YES"
-                mkt.yes_book = snapshot
-                return snapshot
-            elif mkt.no_token_id == token_id:
-                snapshot.outcome = "NO"
-                mkt.no_book = snapshot
-                return snapshot
-
-        return None
+        if outcome == "YES":
+            mkt.yes_book = snapshot
+        else:
+            mkt.no_book = snapshot
+        return snapshot
 
     def scan_all(self) -> list[ArbSignal]:
         """Scan all markets for arbitrage opportunities."""
         signals: list[ArbSignal] = []
         self._scan_count += 1
 
-        for mkt in self.markets.values():
-            if not mkt.active or not mkt.is_ready:
+        for mkt in self._index.slots:
+            if mkt is None or not mkt.active or not mkt.is_ready:
                 continue
 
             signal = self._check_market(mkt)
@@ -175,70 +140,54 @@ class ArbitrageEngine:
 
     def _check_market(self, mkt: MarketState) -> ArbSignal | None:
         assert mkt.yes_book and mkt.no_book
-
-        # Check BUY_BOTH: buy YES ask + buy NO ask < 1.0
-        yes_ask = mkt.yes_book.best_ask
-        no_ask = mkt.no_book.best_ask
+        yes_book, no_book = mkt.yes_book, mkt.no_book
+        yes_ask, no_ask = yes_book.best_ask, no_book.best_ask
+        yes_bid, no_bid = yes_book.best_bid, no_book.best_bid
         buy_cost = yes_ask + no_ask
+        sell_proceeds = yes_bid + no_bid
+
+        # Most markets clear neither gate; bail before any per-side work.
+        if buy_cost >= 1.0 and sell_proceeds <= 1.0:
+            return None
+
+        # (signal_type, yes_price, no_price, combined, spread_bps, max_size)
+        hit: tuple[str, float, float, float, float, float] | None = None
 
+        # BUY_BOTH: buy YES ask + buy NO ask < 1.0
         if buy_cost < 1.0:
             spread_bps = (1.0 - buy_cost) / buy_cost * 10000
-            if spread_bps >= self.min_spread_bps:
-                max_size = min(
-                    mkt.yes_book.best_ask_size,
-                    mkt.no_book.best_ask_size,
-                )
-                min_liq = min(
-                    mkt.yes_book.best_ask_size * yes_ask,
-                    mkt.no_book.best_ask_size * no_ask,
-                )
-                if min_liq >= self.min_liquidity:
-                    return ArbSignal(
-                        id=str(uuid.uuid4())[:8],
-                        market_id=mkt.market_id,
-                        condition_id=mkt.condition_id,
-                        signal_type="BUY_BOTH",
-                        yes_price=yes_ask,
-                        no_price=no_ask,
-                        combined_cost=buy_cost,
-                        spread_bps=spread_bps,
-                        max_size=max_size,
-                        yes_token_id=mkt.yes_token_id,
-                        no_token_id=mkt.no_token_id,
-                    )
-
-        # Check SELL_BOTH: sell YES bid + sell NO bid > 1.0
-        yes_bid = mkt.yes_book.best_bid
-        no_bid = mkt.no_book.best_bid
-        sell_proceeds = yes_bid + no_bid
-
-        if sell_proceeds > 1.0:
-            spread_bps = (sell_proceeds - 1.0) / 1.0 * 10000
-            if spread_bps >= self.min_spread_bps:
-                max_size = min(
-                    mkt.yes_book.best_bid_size,
-                    mkt.no_book.best_bid_size,
-                )
-                min_liq = min(
-                    mkt.yes_book.best_bid_size * yes_bid,
-                    mkt.no_book.best_bid_size * no_bid,
-                )
-                if min_liq >= self.min_liquidity:
-                    return ArbSignal(
-                        id=str(uuid.uuid4())[:8],
-                        market_id=mkt.market_id,
-                        condition_id=mkt.condition_id,
-                        signal_type="SELL_BOTH",
-                        yes_price=yes_bid,
-                        no_price=no_bid,
-                        combined_cost=sell_proceeds,
-                        spread_bps=spread_bps,
-                        max_size=max_size,
-                        yes_token_id=mkt.yes_token_id,
-                        no_token_id=mkt.no_token_id,
-                    )
-
-        return None
+            yes_size, no_size = yes_book.best_ask_size, no_book.best_ask_size
+            if (spread_bps >= self.min_spread_bps
+                    and min(yes_size * yes_ask, no_size * no_ask) >= self.min_liquidity):
+                hit = ("BUY_BOTH", yes_ask, no_ask, buy_cost, spread_bps, min(yes_size, no_size))
+
+        # SELL_BOTH: sell YES bid + sell NO bid > 1.0
+        if hit is None and sell_proceeds > 1.0:
+            spread_bps = (sell_proceeds - 1.0) * 10000
+            yes_size, no_size = yes_book.best_bid_size, no_book.best_bid_size
+            if (spread_bps >= self.min_spread_bps
+                    and min(yes_size * yes_bid, no_size * no_bid) >= self.min_liquidity):
+                hit = ("SELL_BOTH", yes_bid, no_bid, sell_proceeds, spread_bps,
+                       min(yes_size, no_size))
+
+        if hit is None:
+            return None
+
+        # Only markets that pass every filter pay for the dataclass construction.
+        signal_type, yes_price, no_price, combined, spread_bps, max_size = hit
+        return ArbSignal(
+            id=str(uuid.uuid4())[:8],
+            market_id=mkt.market_id,
+            condition_id=mkt.condition_id,
+            signal_type=signal_type,
+            yes_price=yes_price,
+            no_price=no_price,
+            combined_cost=combined,
+            spread_bps=spread_bps,
+            max_size=max_size,
+            yes_token_id=mkt.yes_token_id,
+            no_token_id=mkt.no_token_id,
+        )
 
     @property
     def stats(self) -> dict[str, Any]:
@@ -0,0 +1,130 @@
+"""Order book and market bookkeeping shared by the strategy engines."""
+
+from __future__ import annotations
+
+import heapq
+import time
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Generic, Protocol, TypeVar
+
+_price_size = itemgetter("price", "size")
+
+
+def parse_levels(levels: list[dict]) -> list[tuple[float, float]]:
+    """Convert raw [{"price": "0.45", "size": "120"}, ...] levels to float tuples."""
+    return [(float(p), float(s)) for p, s in map(_price_size, levels)]
+
+
+@dataclass(slots=True)
+class BookSnapshot:
+    token_id: str
+    outcome: str  # YES or NO
+    bids: list[tuple[float, float]]  # [(price, size), ...] unordered; see top_bids()
+    asks: list[tuple[float, float]]  # [(price, size), ...] unordered; see top_asks()
+    timestamp: float = field(default_factory=time.time)
+    # Top-of-book levels, found in one O(N) pass instead of sorting every update.
+    _top_bid: tuple[float, float] | None = field(default=None, init=False, repr=False)
+    _top_ask: tuple[float, float] | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.bids:
+            self._top_bid = max(self.bids, key=itemgetter(0))
+        if self.asks:
+            self._top_ask = min(self.asks, key=itemgetter(0))
+
+    def top_bids(self, n: int) -> list[tuple[float, float]]:
+        """Best n bid levels, price descending."""
+        return heapq.nlargest(n, self.bids, key=itemgetter(0))
+
+    def top_asks(self, n: int) -> list[tuple[float, float]]:
+        """Best n ask levels, price ascending."""
+        return heapq.nsmallest(n, self.asks, key=itemgetter(0))
+
+    @property
+    def best_bid(self) -> float:
+        return self._top_bid[0] if self._top_bid else 0
+
+    @property
+    def best_ask(self) -> float:
+        return self._top_ask[0] if self._top_ask else 1.0
+
+    @property
+    def best_bid_size(self) -> float:
+        return self._top_bid[1] if self._top_bid else 0
+
+    @property
+    def best_ask_size(self) -> float:
+        return self._top_ask[1] if self._top_ask else 0
+
+    @property
+    def mid(self) -> float:
+        if self.bids and self.asks:
+            return (self.best_bid + self.best_ask) / 2
+        return self.best_bid or self.best_ask
+
+    @property
+    def spread_bps(self) -> float:
+        if self.best_bid > 0:
+            return (self.best_ask - self.best_bid) / self.best_bid * 10000
+        return 0
+
+
+class _Tradable(Protocol):
+    condition_id: str
+    yes_token_id: str
+    no_token_id: str
+
+
+M = TypeVar("M", bound=_Tradable)
+
+
+class MarketIndex(Generic[M]):
+    """Flat slot list for scan loops plus a token_id -> (market, outcome) index."""
+
+    __slots__ = ("slots", "_slot_of", "_holes", "_by_token")
+
+    def __init__(self) -> None:
+        # Removed markets leave a None hole until compaction.
+        self.slots: list[M | None] = []
+        self._slot_of: dict[str, int] = {}
+        self._holes = 0
+        # token_id -> (market, outcome), so book updates don't scan every market.
+        self._by_token: dict[str, tuple[M, str]] = {}
+
+    def add(self, market: M) -> None:
+        slot = self._slot_of.get(market.condition_id)
+        if slot is None:
+            self._slot_of[market.condition_id] = len(self.slots)
+            self.slots.append(market)
+        else:
+            old = self.slots[slot]
+            if old is not None:
+                self._unindex_tokens(old)
+            self.slots[slot] = market
+        self._by_token.setdefault(market.yes_token_id, (market, "YES"))
+        self._by_token.setdefault(market.no_token_id, (market, "NO"))
+
+    def remove(self, condition_id: str) -> None:
+        slot = self._slot_of.pop(condition_id, None)
+        if slot is None:
+            return
+        market = self.slots[slot]
+        if market is not None:
+            self._unindex_tokens(market)
+        self.slots[slot] = None
+        self._holes += 1
+        if self._holes * 2 > len(self.slots):
+            self.slots = [m for m in self.slots if m is not None]
+            self._slot_of = {m.condition_id: i for i, m in enumerate(self.slots)}
+            self._holes = 0
+
+    def lookup(self, token_id: str) -> tuple[M, str] | None:
+        """The (market, outcome) a token belongs to, or None if untracked."""
+        return self._by_token.get(token_id)
+
+    def _unindex_tokens(self, market: M) -> None:
+        for token_id in (market.yes_token_id, market.no_token_id):
+            entry = self._by_token.get(token_id)
+            if entry is not None and entry[0] is market:
+                del self._by_token[token_id]
@@ -7,48 +7,21 @@ import uuid
 from dataclasses import dataclass, field
 from typing import Any
 
+from yuga.strategy.common import BookSnapshot, MarketIndex, parse_levels
 
-@dataclass
-class OrderBookSnapshot:
-    token_id: str
-    outcome: str  # YES or NO
-    bids: list[tuple[float, float]]  # [(price, size), ...] sorted desc
-    asks: list[tuple[float, float]]  # [(price, size), ...] sorted asc
-    timestamp: float = field(default_factory=time.time)
-
-    @property
-    def best_bid(self) -> float:
-        return self.bids[0][0] if self.bids else 0
-
-    @property
-    def best_ask(self) -> float:
-        return self.asks[0][0] if self.asks else 1.0
-
-    @property
-    def best_bid_size(self) -> float:
-        return self.bids[0][1] if self.bids else 0
 
-    @property
-    def best_ask_size(self) -> float:
-        return self.asks[0][1] if self.asks else 0
+def _clamp_px(p: float) -> float:
+    """Clamp a quote price into the tradable range and round to tick precision."""
+    return round(0.01 if p < 0.01 else 0.99 if p > 0.99 else p, 3)
 
-    @property
-    def mid(self) -> float:
-        if self.bids and self.asks:
-            return (self.best_bid + self.best_ask) / 2
-        return self.best_bid or self.best_ask
-
-    @property
-    def spread_bps(self) -> float:
-        if self.best_bid > 0:
-            return (self.best_ask - self.best_bid) / self.best_bid * 10000
-        return 0
 
+@dataclass(slots=True)
+class OrderBookSnapshot(BookSnapshot):
     def is_stale(self, max_age_ms: int = 2000) -> bool:
         return (time.time() - self.timestamp) > (max_age_ms / 1000)
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketState:
     market_id: str
     condition_id: str
@@ -59,17 +32,22 @@ class MarketState:
     no_book: OrderBookSnapshot | None = None
     active: bool = True
     last_quote: float = 0
+    # Scanner label, truncated once here instead of on every render.
+    display_name: str = field(default="", init=False)
+
+    def __post_init__(self) -> None:
+        self.display_name = self.question[:30]
 
     def is_ready(self, max_age_ms: int = 2000) -> bool:
-        return (
-            self.yes_book is not None
-            and self.no_book is not None
-            and not self.yes_book.is_stale(max_age_ms)
-            and not self.no_book.is_stale(max_age_ms)
-        )
+        yes_book, no_book = self.yes_book, self.no_book
+        if yes_book is None or no_book is None:
+            return False
+        # One clock read for both sides; equivalent to two is_stale() checks.
+        cutoff = time.time() - max_age_ms / 1000
+        return yes_book.timestamp >= cutoff and no_book.timestamp >= cutoff
 
 
-@dataclass
+@dataclass(slots=True)
 class QuoteOrder:
     token_id: str
     outcome: str  # YES or NO
@@ -78,7 +56,7 @@ class QuoteOrder:
     size: float
 
 
-@dataclass
+@dataclass(slots=True)
 class QuoteSignal:
     id: str
     market_id: str
@@ -104,42 +82,44 @@ class MarketMakerEngine:
         self.min_liquidity = min_liquidity
         self.price_staleness_ms = price_staleness_ms
         self.markets: dict[str, MarketState] = {}
+        self._index: MarketIndex[MarketState] = MarketIndex()
         self.active_quotes: dict[str, QuoteSignal] = {}
         self._scan_count = 0
         self._quote_count = 0
+        # Bumped whenever books, markets, or quotes change; lets the TUI skip idle redraws.
+        self.revision = 0
 
     def add_market(self, market: MarketState) -> None:
         self.markets[market.condition_id] = market
+        self._index.add(market)
+        self.revision += 1
 
     def remove_market(self, condition_id: str) -> None:
         self.markets.pop(condition_id, None)
+        self._index.remove(condition_id)
         self.active_quotes.pop(condition_id, None)
+        self.revision += 1
 
     def update_book(self, token_id: str, book_data: dict) -> OrderBookSnapshot | None:
-        bids = [(float(b["price"]), float(b["size"])) for b in book_data.get("bids", [])]
-        asks = [(float(a["price"]), float(a["size"])) for a in book_data.get("asks", [])]
-        bids.sort(key=lambda x: x[0], reverse=True)
-        asks.sort(key=lambda x: x[0])
-
+        entry = self._index.lookup(token_id)
+        if entry is None:
+            return None
+        mkt, outcome = entry
+        bids = parse_levels(book_data.get("bids", ()))
+        asks = parse_levels(book_data.get("asks", ()))
         snapshot = OrderBookSnapshot(
             token_id=token_id,
-            outcome="",
+            outcome=outcome,
             bids=bids,
             asks=asks,
             timestamp=time.time(),
         )
-
-        for mkt in self.markets.values():
-            if mkt.yes_token_id == token_id:
-                snapshot.outcome = "YES"
-                mkt.yes_book = snapshot
-                return snapshot
-            if mkt.no_token_id == token_id:
-                snapshot.outcome = "NO"
-                mkt.no_book = snapshot
-                return snapshot
-
-        return None
+        if outcome == "YES":
+            mkt.yes_book = snapshot
+        else:
+            mkt.no_book = snapshot
+        self.revision += 1
+        return snapshot
 
     def generate_quotes(
         self,
@@ -151,19 +131,22 @@ class MarketMakerEngine:
         self._scan_count += 1
         signals: list[QuoteSignal] = []
 
-        for mkt in self.markets.values():
-            if not mkt.active or not mkt.is_ready(self.price_staleness_ms):
+        for mkt in self._index.slots:
+            if mkt is None or not mkt.active or not mkt.is_ready(self.price_staleness_ms):
                 continue
 
             inv = inventory.get(mkt.condition_id, {})
             signal = self._quote_market(mkt, inv, inventory_limit)
             if signal:
+                prev = self.active_quotes.get(mkt.condition_id)
+                if prev is None or prev.orders != signal.orders:
+                    self.revision += 1
                 signals.append(signal)
                 self.active_quotes[mkt.condition_id] = signal
                 self._quote_count += 1
                 mkt.last_quote = time.time()
-            else:
-                self.active_quotes.pop(mkt.condition_id, None)
+            elif self.active_quotes.pop(mkt.condition_id, None) is not None:
+                self.revision += 1
 
         return signals
 
@@ -174,10 +157,15 @@ class MarketMakerEngine:
         inventory_limit: float,
     ) -> QuoteSignal | None:
         assert mkt.yes_book and mkt.no_book
+        yes_book, no_book = mkt.yes_book, mkt.no_book
+        yes_mid = yes_book.mid
+        no_mid = no_book.mid
+        yes_bid_size, yes_ask_size = yes_book.best_bid_size, yes_book.best_ask_size
+        no_bid_size, no_ask_size = no_book.best_bid_size, no_book.best_ask_size
 
         # Ensure basic liquidity
-        yes_liq = min(mkt.yes_book.best_bid_size, mkt.yes_book.best_ask_size) * mkt.yes_book.mid
-        no_liq = min(mkt.no_book.best_bid_size, mkt.no_book.best_ask_size) * mkt.no_book.mid
+        yes_liq = min(yes_bid_size, yes_ask_size) * yes_mid
+        no_liq = min(no_bid_size, no_ask_size) * no_mid
         if min(yes_liq, no_liq) < self.min_liquidity:
             return None
 
@@ -190,45 +178,38 @@ class MarketMakerEngine:
         spread_scale = 1.0 + skew_ratio
         size_scale = max(0.2, 1.0 - skew_ratio)
 
-        half_spread_yes = (self.quote_spread_bps / 20000) * mkt.yes_book.mid * spread_scale
-        half_spread_no = (self.quote_spread_bps / 20000) * mkt.no_book.mid * spread_scale
+        max_size = min(yes_bid_size, yes_ask_size, no_bid_size, no_ask_size) * size_scale
+        if max_size <= 0:
+            return None
 
-        def _px(p: float) -> float:
-            return round(min(max(p, 0.01), 0.99), 3)
+        half_spread = self.quote_spread_bps / 20000
+        half_spread_yes = half_spread * yes_mid * spread_scale
+        half_spread_no = half_spread * no_mid * spread_scale
 
-        yes_bid = _px(mkt.yes_book.mid - half_spread_yes)
-        yes_ask = _px(mkt.yes_book.mid + half_spread_yes)
-        no_bid = _px(mkt.no_book.mid - half_spread_no)
-        no_ask = _px(mkt.no_book.mid + half_spread_no)
+        yes_bid = _clamp_px(yes_mid - half_spread_yes)
+        yes_ask = _clamp_px(yes_mid + half_spread_yes)
+        no_bid = _clamp_px(no_mid - half_spread_no)
+        no_ask = _clamp_px(no_mid + half_spread_no)
 
         if yes_bid >= yes_ask or no_bid >= no_ask:
             return None
 
-        max_size = min(
-            mkt.yes_book.best_bid_size,
-            mkt.yes_book.best_ask_size,
-            mkt.no_book.best_bid_size,
-            mkt.no_book.best_ask_size,
-        )
-        max_size = max_size * size_scale
-
         spread_bps = (yes_ask - yes_bid) / max(yes_bid, 0.0001) * 10000
 
-        orders = [
-            QuoteOrder(mkt.yes_token_id, "YES", "BUY", yes_bid, max_size),
-            QuoteOrder(mkt.yes_token_id, "YES", "SELL", yes_ask, max_size),
-            QuoteOrder(mkt.no_token_id, "NO", "BUY", no_bid, max_size),
-            QuoteOrder(mkt.no_token_id, "NO", "SELL", no_ask, max_size),
-        ]
-
+        # Orders are only built once every filter has passed.
         return QuoteSignal(
             id=str(uuid.uuid4())[:8],
             market_id=mkt.market_id,
             condition_id=mkt.condition_id,
             spread_bps=spread_bps,
-            mid_yes=mkt.yes_book.mid,
-            mid_no=mkt.no_book.mid,
-            orders=orders,
+            mid_yes=yes_mid,
+            mid_no=no_mid,
+            orders=[
+                QuoteOrder(mkt.yes_token_id, "YES", "BUY", yes_bid, max_size),
+                QuoteOrder(mkt.yes_token_id, "YES", "SELL", yes_ask, max_size),
+                QuoteOrder(mkt.no_token_id, "NO", "BUY", no_bid, max_size),
+                QuoteOrder(mkt.no_token_id, "NO", "SELL", no_ask, max_size),
+            ],
             max_size=max_size,
         )
 
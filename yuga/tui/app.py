@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import time
+import asyncio
+from typing import Any, Callable
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
-from textual.widgets import Footer, Static
-from textual.timer import Timer
+from textual.widgets import Footer
 
 from yuga.engine import Engine
 from yuga.tui.widgets.market_scanner import MarketScanner
@@ -126,6 +126,34 @@ class YugaApp(App):
     DARK = True
     CSS = CSS
 
+    # Command name -> handler method; built once rather than per submitted command.
+    _CMD_HANDLERS: dict[str, str] = {
+        "pause": "_cmd_pause",
+        "resume": "_cmd_resume",
+        "cancel-all": "_cmd_cancel",
+        "cancel": "_cmd_cancel",
+        "reload": "_cmd_reload",
+        "reload-config": "_cmd_reload",
+        "status": "_cmd_status",
+        "next-book": "_cmd_next_book",
+        "prev-book": "_cmd_prev_book",
+        "ob-next": "_cmd_next_book",
+        "ob-prev": "_cmd_prev_book",
+        "book-auto": "_cmd_toggle_book_rotation",
+        "book-auto-on": "_cmd_book_auto_on",
+        "book-auto-off": "_cmd_book_auto_off",
+        "reset-cb": "_cmd_reset_cb",
+        "reset": "_cmd_reset_cb",
+        "quit": "_cmd_quit",
+        "exit": "_cmd_quit",
+        "q": "_cmd_quit",
+    }
+    _SYNC_CMDS = frozenset({"quit", "exit", "q"})
+
+    # Redraw coalescing window, and the tick for clock-driven fields (uptime, order ages).
+    REFRESH_MIN_INTERVAL_S = 0.1
+    CLOCK_INTERVAL_S = 1.0
+
     BINDINGS = [
         Binding("q", "quit", "quit", show=True, priority=True),
         Binding("p", "toggle_pause", "pause", show=True),
@@ -140,7 +168,9 @@ class YugaApp(App):
     def __init__(self, engine: Engine, **kwargs) -> None:
         super().__init__(**kwargs)
         self.engine = engine
-        self._refresh_timer: Timer | None = None
+        self._refresh_task: asyncio.Task | None = None
+        self._last_state_version: dict[str, tuple] = {}
+        self._last_activity: tuple = ()
 
     def compose(self) -> ComposeResult:
         yield MetricsBar(id="status-bar")
@@ -158,50 +188,128 @@ class YugaApp(App):
         yield Footer()
 
     async def on_mount(self) -> None:
+        # Resolved once so the refresh tick is plain attribute access.
+        self._w_status = self.query_one("#status-bar", MetricsBar)
+        self._w_orderbook = self.query_one("#orderbook-box", OrderBookPanel)
+        self._w_scanner = self.query_one("#scanner-box", MarketScanner)
+        self._w_orders = self.query_one("#orders-box", OrderFeed)
+        self._w_risk = self.query_one("#risk-box", PositionsPanel)
+        self._w_pnl = self.query_one("#pnl-box", PnLChart)
+        self._w_odds = self.query_one("#odds-box", OddsChart)
+        self._w_pipeline = self.query_one("#pipeline-box", PipelinePanel)
         try:
             await self.engine.start()
         except Exception as e:
             self._update_log(f"[bold red]engine start failed: {e}[/]")
-        self._refresh_timer = self.set_interval(0.5, self._refresh_ui)
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+        self.set_interval(self.CLOCK_INTERVAL_S, self._refresh_clock)
 
     async def on_unmount(self) -> None:
-        if self._refresh_timer:
-            self._refresh_timer.stop()
+        if self._refresh_task:
+            self._refresh_task.cancel()
         try:
             await self.engine.stop()
         except Exception:
             pass
 
+    async def _refresh_loop(self) -> None:
+        dirty = self.engine.state_dirty
+        while True:
+            await dirty.wait()
+            dirty.clear()
+            await self._refresh_ui()
+            await asyncio.sleep(self.REFRESH_MIN_INTERVAL_S)
+
     async def _refresh_ui(self) -> None:
+        # One guard for the whole pass; a failing widget surfaces in the command bar.
         try:
             state = self.engine.get_state()
-        except Exception:
-            return
+            revs = state.revs
+            ob_view = state.orderbook_view
+            odds_view = state.odds_view
+            mm_stats = state.mm_stats
+            exec_stats = state.exec_stats
+            risk_status = state.risk_status
+            recent_orders = state.recent_orders
+
+            # While paused with no book, order, risk or selection changes only the clock moves.
+            activity = (state.paused, tuple(revs.values()),
+                        ob_view.get("condition_id"), ob_view.get("rotate_mode"))
+            if state.paused and activity == self._last_activity:
+                self._push("status-bar", None, self._w_status.update_metrics, state)
+                return
+            self._last_activity = activity
+
+            # Each widget is keyed by the revisions it renders from plus any clock-driven
+            # fields at display precision; a None version redraws every tick.
+            # Batched so all panel changes land in a single repaint.
+            with self.batch_update():
+                self._push("status-bar", None, self._w_status.update_metrics, state)
+                self._push(
+                    "orderbook-box",
+                    (revs.get("markets"), revs.get("orders"), ob_view.get("condition_id"),
+                     ob_view.get("rotate_mode"), ob_view.get("ready_total"),
+                     round(ob_view.get("rotate_in_s", 0.0), 1), ob_view.get("is_live"),
+                     0.0 if ob_view.get("is_live", True) else round(ob_view.get("stale_age_s", 0.0), 1)),
+                    self._w_orderbook.update_book, ob_view,
+                )
+                self._push(
+                    "scanner-box", (revs.get("markets"), tuple(state.markets.ready)),
+                    self._w_scanner.update_markets, state.markets, state.active_quotes,
+                )
+                self._push(
+                    "orders-box", (revs.get("orders"), int(state.uptime_s) if recent_orders else 0),
+                    self._w_orders.update_orders, recent_orders,
+                )
+                self._push(
+                    "risk-box",
+                    (revs.get("orders"), revs.get("risk"),
+                     risk_status.get("circuit_breaker_active"),
+                     round(risk_status.get("circuit_breaker_remaining_s", 0))),
+                    self._w_risk.update_state, exec_stats, risk_status, state.inventory,
+                )
+                self._push(
+                    "pnl-box", (revs.get("orders"),),
+                    self._w_pnl.update_pnl, state.pnl_history, exec_stats,
+                )
+                self._push(
+                    "odds-box",
+                    (revs.get("odds"), odds_view.get("condition_id"),
+                     odds_view.get("yes_now"), odds_view.get("no_now"), odds_view.get("is_live"),
+                     0.0 if odds_view.get("is_live") else round(odds_view.get("stale_age_s", 0.0), 1)),
+                    self._w_odds.update_odds, odds_view,
+                )
+                self._push(
+                    "pipeline-box",
+                    (state.pipeline_stage, state.paused,
+                     tuple(mm_stats.values()), exec_stats.get("active_quotes")),
+                    self._w_pipeline.update_pipeline,
+                    state.pipeline_stage, mm_stats, exec_stats, recent_orders,
+                )
+        except Exception as e:
+            self._update_log(f"[bold red]refresh error: {e}[/]")
 
-        for widget_id, cls, method, args in [
-            ("status-bar", MetricsBar, "update_metrics", (state,)),
-            ("orderbook-box", OrderBookPanel, "update_book",
-             (state.get("orderbook_view", {}),)),
-            ("scanner-box", MarketScanner, "update_markets",
-             (state.get("markets", []), state.get("active_quotes", {}))),
-            ("orders-box", OrderFeed, "update_orders", (state.get("recent_orders", []),)),
-            ("risk-box", PositionsPanel, "update_state",
-             (state.get("exec_stats", {}), state.get("risk_status", {}),
-              state.get("inventory", []))),
-            ("pnl-box", PnLChart, "update_pnl",
-             (state.get("pnl_history", []), state.get("exec_stats", {}))),
-            ("odds-box", OddsChart, "update_odds",
-             (state.get("odds_view", {}),)),
-            ("pipeline-box", PipelinePanel, "update_pipeline",
-             (state.get("pipeline_stage", "IDLE"),
-              state.get("mm_stats", {}), state.get("exec_stats", {}),
-              state.get("recent_orders", []))),
-        ]:
-            try:
-                w = self.query_one(f"#{widget_id}", cls)
-                getattr(w, method)(*args)
-            except Exception:
-                pass
+    def _refresh_clock(self) -> None:
+        """Redraw only the clock-driven widgets, without building a full engine snapshot."""
+        try:
+            clock = self.engine.get_clock_state()
+            recent_orders = clock.recent_orders
+            with self.batch_update():
+                self._push("status-bar", None, self._w_status.update_metrics, clock)
+                self._push(
+                    "orders-box", (clock.orders_rev, int(clock.uptime_s) if recent_orders else 0),
+                    self._w_orders.update_orders, recent_orders,
+                )
+        except Exception as e:
+            self._update_log(f"[bold red]refresh error: {e}[/]")
+
+    def _push(self, key: str, version: tuple | None, update: Callable[..., None], *args: Any) -> None:
+        """Call a widget update unless its inputs match the last successful render."""
+        if version is not None and self._last_state_version.get(key) == version:
+            return
+        update(*args)
+        if version is not None:
+            self._last_state_version[key] = version
 
     # -- Commands --
 
@@ -209,33 +317,18 @@ class YugaApp(App):
         cmd = event.command
         bar = self.query_one("#cmd-box", CommandBar)
 
-        handlers = {
-            "pause": self._cmd_pause,
-            "resume": self._cmd_resume,
-            "cancel-all": self._cmd_cancel,
-            "cancel": self._cmd_cancel,
-            "reload": self._cmd_reload,
-            "reload-config": self._cmd_reload,
-            "status": self._cmd_status,
-            "next-book": self._cmd_next_book,
-            "prev-book": self._cmd_prev_book,
-            "ob-next": self._cmd_next_book,
-            "ob-prev": self._cmd_prev_book,
-            "book-auto": self._cmd_toggle_book_rotation,
-            "book-auto-on": self._cmd_book_auto_on,
-            "book-auto-off": self._cmd_book_auto_off,
-            "reset-cb": self._cmd_reset_cb,
-            "reset": self._cmd_reset_cb,
-            "quit": lambda b: self.exit(),
-            "exit": lambda b: self.exit(),
-            "q": lambda b: self.exit(),
-        }
-
-        handler = handlers.get(cmd)
-        if handler:
-            await handler(bar) if cmd not in ("quit", "exit", "q") else handler(bar)
-        else:
+        name = self._CMD_HANDLERS.get(cmd)
+        if name is None:
             bar.set_output(f"[bold red]\u2718 unknown: {cmd}[/]")
+            return
+        handler = getattr(self, name)
+        if cmd in self._SYNC_CMDS:
+            handler(bar)
+        else:
+            await handler(bar)
+
+    def _cmd_quit(self, bar: CommandBar) -> None:
+        self.exit()
 
     async def _cmd_pause(self, bar: CommandBar) -> None:
         await self.engine.pause()
@@ -254,8 +347,9 @@ class YugaApp(App):
         bar.set_output("[green]\u21bb config reloaded[/]")
 
     async def _cmd_status(self, bar: CommandBar) -> None:
-        s = self.engine.get_state()["exec_stats"]
-        a = self.engine.get_state()["mm_stats"]
+        state = self.engine.get_state()
+        s = state.exec_stats
+        a = state.mm_stats
         bar.set_output(
             f"orders {s['total_orders']}  "
             f"fills {s['total_fills']}  "
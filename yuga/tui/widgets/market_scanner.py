@@ -2,9 +2,48 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from textual.app import ComposeResult
 from textual.widgets import Static, DataTable
 
+if TYPE_CHECKING:
+    from yuga.engine import MarketsSnapshot
+
+# Cell styles indexed by classification code (idle/ready/signal, tight/normal/wide).
+_DOT_CELLS = ("[#928374]\u25cb[/]", "[#b8bb26]\u25cf[/]", "[#fabd2f]\u2738[/]")
+_READY_CELLS = ("[#928374]\u25cb[/]", "[#b8bb26]\u25cf[/]")
+_SPREAD_FMTS = (
+    "[bold #b8bb26]{:.1f}bp[/]".format,
+    "[#a89984]{:.1f}bp[/]".format,
+    "[bold #fb4934]{:.1f}bp[/]".format,
+)
+_SIG_FMT = "[bold #fabd2f]\u26a1 {:.0f}bp[/]".format
+_NO_SIG = "[#928374]\u2013[/]"
+
+_TITLE_FMT = "\u25c8 [bold #83a598]MARKETS[/] {}".format
+_TITLE_READY_FMT = "[#b8bb26]\u25cf {}[/]".format
+_TITLE_NONE_READY = "[#928374]\u25cb 0[/]"
+_TITLE_SIGS_FMT = "[#fabd2f]\u26a1{}[/]".format
+
+
+@lru_cache(maxsize=4096)
+def _build_row(
+    name: str, yes_mid: float, no_mid: float, sa: float, is_ready: int, sig_bps: float | None
+) -> tuple[str, ...]:
+    """Render one scanner row; unchanged inputs return the same shared tuple."""
+    spread_code = 0 if sa < 20 else 2 if sa > 80 else 1
+    return (
+        _DOT_CELLS[is_ready if sig_bps is None else 2],
+        name,
+        f"{yes_mid:.3f}",
+        f"{no_mid:.3f}",
+        _SPREAD_FMTS[spread_code](sa),
+        _READY_CELLS[is_ready],
+        _NO_SIG if sig_bps is None else _SIG_FMT(sig_bps),
+    )
+
 
 class MarketScanner(Static):
 
@@ -45,51 +84,47 @@ class MarketScanner(Static):
         t = self.query_one("#sc-table", DataTable)
         t.cursor_type = "row"
         t.zebra_stripes = True
-        t.add_columns("\u25cf", "market", "y.mid", "n.mid", "y.spread", "ready", "\u26a1")
+        self._columns = t.add_columns(
+            "\u25cf", "market", "y.mid", "n.mid", "y.spread", "ready", "\u26a1"
+        )
+        # Last rendered cells per row; rows are keyed by position so only changed cells redraw.
+        self._rows: list[tuple[str, ...]] = []
 
-    def update_markets(self, markets: list[dict], signals: dict) -> None:
+    def update_markets(self, markets: MarketsSnapshot, signals: dict) -> None:
         t = self.query_one("#sc-table", DataTable)
-        t.clear()
 
-        ready = sum(1 for m in markets if m["ready"])
+        ready = markets.ready.count(True)
         sig_count = len(signals)
         parts = [
-            f"\u25c8 [bold #83a598]MARKETS[/] {len(markets)}",
-            f"[#b8bb26]\u25cf {ready}[/]" if ready else "[#928374]\u25cb 0[/]",
+            _TITLE_FMT(len(markets)),
+            _TITLE_READY_FMT(ready) if ready else _TITLE_NONE_READY,
         ]
         if sig_count:
-            parts.append(f"[#fabd2f]\u26a1{sig_count}[/]")
+            parts.append(_TITLE_SIGS_FMT(sig_count))
         self.query_one("#sc-title", Static).update("  ".join(parts))
 
-        for m in markets:
-            sig = signals.get(m["id"])
-            sa = m.get("spread_bps", 0)
-
-            if sig:
-                dot = "[#fabd2f]\u2738[/]"
-            elif m["ready"]:
-                dot = "[#b8bb26]\u25cf[/]"
-            else:
-                dot = "[#928374]\u25cb[/]"
-
-            if sa < 20:
-                sc = f"[bold #b8bb26]{sa:.1f}bp[/]"
-            elif sa > 80:
-                sc = f"[bold #fb4934]{sa:.1f}bp[/]"
-            else:
-                sc = f"[#a89984]{sa:.1f}bp[/]"
-
-            if sig:
-                sig_text = f"[bold #fabd2f]\u26a1 {sig['spread_bps']:.0f}bp[/]"
-            else:
-                sig_text = "[#928374]\u2013[/]"
-
-            t.add_row(
-                dot,
-                m["question"][:30],
-                f"{m['yes_mid']:.3f}",
-                f"{m['no_mid']:.3f}",
-                sc,
-                "[#b8bb26]\u25cf[/]" if m["ready"] else "[#928374]\u25cb[/]",
-                sig_text,
-            )
+        rows: list[tuple[str, ...]] = []
+        for market_id, name, yes_mid, no_mid, sa, ready_flag in zip(
+            markets.ids, markets.names, markets.yes_mid,
+            markets.no_mid, markets.spread_bps, markets.ready,
+        ):
+            sig = signals.get(market_id)
+            rows.append(_build_row(
+                name, yes_mid, no_mid, sa, 1 if ready_flag else 0,
+                sig["spread_bps"] if sig else None,
+            ))
+        self._sync_rows(t, rows)
+
+    def _sync_rows(self, t: DataTable, rows: list[tuple[str, ...]]) -> None:
+        old = self._rows
+        for i, (new, prev) in enumerate(zip(rows, old)):
+            if new is prev or new == prev:
+                continue
+            for col, value, was in zip(self._columns, new, prev):
+                if value != was:
+                    t.update_cell(str(i), col, value, update_width=True)
+        for i in range(len(old) - 1, len(rows) - 1, -1):
+            t.remove_row(str(i))
+        for i in range(len(old), len(rows)):
+            t.add_row(*rows[i], key=str(i))
+        self._rows = rows
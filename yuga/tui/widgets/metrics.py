@@ -2,16 +2,37 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from textual.app import ComposeResult
 from textual.widgets import Static
 
+if TYPE_CHECKING:
+    from yuga.engine import ClockSnapshot, EngineSnapshot
+
+
+# Latency cell templates: fast, slow, bad.
+_LAT_FMTS = (
+    "[#b8bb26]{:.0f}[/][#928374]ms[/]".format,
+    "[#fabd2f]{:.0f}[/][#928374]ms[/]".format,
+    "[#fb4934]{:.0f}[/][#928374]ms[/]".format,
+)
+
+
+@lru_cache(maxsize=1024)
+def _lat_cell(bucket: int, ms: int) -> str:
+    return _LAT_FMTS[bucket](ms)
+
 
 def _lat(ms: float, lo: float = 50, hi: float = 200) -> str:
-    if ms < lo:
-        return f"[#b8bb26]{ms:.0f}[/][#928374]ms[/]"
-    if ms < hi:
-        return f"[#fabd2f]{ms:.0f}[/][#928374]ms[/]"
-    return f"[#fb4934]{ms:.0f}[/][#928374]ms[/]"
+    # Bucket on the raw value, key on the displayed (half-even rounded) millisecond.
+    return _lat_cell((ms >= lo) + (ms >= hi), round(ms))
+
+
+# Indexed by link state: disconnected, connected but quiet, connected and fresh.
+_WS_ICONS = ("[#fb4934]\u25cb[/]", "[#fabd2f]\u25ce[/]", "[#b8bb26]\u25c9[/]")
+_STATUS = ("[#b8bb26]\u25c9 LIVE[/]", "[#fb4934]\u23f8 PAUSED[/]")
 
 
 class MetricsBar(Static):
@@ -24,35 +45,39 @@ class MetricsBar(Static):
     }
     """
 
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        # Uptime string is reformatted only when the whole second changes.
+        self._last_sec = -1
+        self._time_str = ""
+        self._last_text = ""
+
     def compose(self) -> ComposeResult:
         yield Static("", id="bar-text")
 
-    def update_metrics(self, state: dict) -> None:
-        ws = state.get("ws_state", {})
+    def on_mount(self) -> None:
+        self._bar = self.query_one("#bar-text", Static)
+
+    def update_metrics(self, state: EngineSnapshot | ClockSnapshot) -> None:
+        ws = state.ws_state
         connected = ws.get("connected", False)
         ws_lat = ws.get("latency_ms", 0)
         subs = ws.get("subscribed", 0)
         recon = ws.get("reconnects", 0)
         msg_age = ws.get("last_msg_age_s", 0)
-        clob_lat = state.get("clob_latency_ms", 0)
-        uptime = state.get("uptime_s", 0)
-        paused = state.get("paused", False)
-
-        if connected and msg_age < 5:
-            ws_icon = "[#b8bb26]\u25c9[/]"
-        elif connected:
-            ws_icon = "[#fabd2f]\u25ce[/]"
-        else:
-            ws_icon = "[#fb4934]\u25cb[/]"
-
-        if paused:
-            status = "[#fb4934]\u23f8 PAUSED[/]"
-        else:
-            status = "[#b8bb26]\u25c9 LIVE[/]"
-
-        h = int(uptime // 3600)
-        m = int((uptime % 3600) // 60)
-        s = int(uptime % 60)
+        clob_lat = state.clob_latency_ms
+        uptime = state.uptime_s
+        paused = state.paused
+
+        ws_icon = _WS_ICONS[(2 if msg_age < 5 else 1) if connected else 0]
+        status = _STATUS[1 if paused else 0]
+
+        sec = int(uptime)
+        if sec != self._last_sec:
+            h, rem = divmod(sec, 3600)
+            m, s = divmod(rem, 60)
+            self._time_str = f"{h:02d}:{m:02d}:{s:02d}"
+            self._last_sec = sec
 
         recon_str = f" [#928374]\u21bb[/][#fb4934]{recon}[/]" if recon > 0 else ""
 
@@ -64,7 +89,9 @@ class MetricsBar(Static):
             f"{ws_icon} [#928374]ws[/] {_lat(ws_lat)}  {sep}  "
             f"\u25c7 [#928374]clob[/] {_lat(clob_lat, 100, 500)}  {sep}  "
             f"[#928374]subs[/] {subs}{recon_str}  {sep}  "
-            f"[#928374]{h:02d}:{m:02d}:{s:02d}[/]"
+            f"[#928374]{self._time_str}[/]"
         )
 
-        self.query_one("#bar-text", Static).update(text)
+        if text != self._last_text:
+            self._last_text = text
+            self._bar.update(text)
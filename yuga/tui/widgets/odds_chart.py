@@ -2,11 +2,114 @@
 
 from __future__ import annotations
 
-from collections import deque
+from array import array
+from collections.abc import Sequence
+from functools import lru_cache
 
 from textual.app import ComposeResult
 from textual.widgets import Static
 
+# The chart is rasterized into small integer cell codes and only mapped to
+# markup once per row at the end, instead of storing a markup string per cell.
+_EMPTY, _DOT_MINOR, _DOT_EDGE, _YES_LINE, _YES_DOT, _NO_LINE, _NO_DOT, _COLLISION = range(8)
+_TOKENS = (
+    " ",
+    "[#504945]\u00b7[/]",
+    "[#3c3836]\u00b7[/]",
+    "[#b8bb26]\u2571[/]",
+    "[#b8bb26]\u25cf[/]",
+    "[#fb4934]\u2572[/]",
+    "[#fb4934]\u25cf[/]",
+    "[bright_white]\u25c6[/]",
+)
+# Background codes sort below every line/marker code, so a collision is one int compare.
+_LINE_MIN = _YES_LINE
+
+_HISTORY_LEN = 180
+_TICKS = (0, 25, 50, 75, 100)
+
+
+class _Ring:
+    """Fixed-capacity ring of unboxed doubles for the odds history."""
+
+    __slots__ = ("_buf", "_head", "_n")
+
+    def __init__(self, capacity: int) -> None:
+        self._buf = array("d", bytes(8 * capacity))
+        self._head = 0
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def push(self, v: float) -> None:
+        cap = len(self._buf)
+        if self._n < cap:
+            self._buf[(self._head + self._n) % cap] = v
+            self._n += 1
+        else:
+            self._buf[self._head] = v
+            self._head = (self._head + 1) % cap
+
+    def replace(self, vals) -> None:
+        data = array("d", vals)[-len(self._buf):]
+        self._buf[:len(data)] = data
+        self._head = 0
+        self._n = len(data)
+
+    def last(self) -> float:
+        return self._buf[(self._head + self._n - 1) % len(self._buf)]
+
+    def snapshot(self) -> array:
+        """Values oldest-first, copied out in at most two slices."""
+        end = self._head + self._n
+        cap = len(self._buf)
+        if end <= cap:
+            return self._buf[self._head:end]
+        return self._buf[self._head:] + self._buf[:end - cap]
+
+
+@lru_cache(maxsize=64)
+def _resample_idx(n: int, width: int) -> tuple[int, ...]:
+    """Source index per column when squeezing n samples into width columns."""
+    return tuple(int(round(i * (n - 1) / max(1, width - 1))) for i in range(width))
+
+
+@lru_cache(maxsize=16)
+def _axis_separator(width: int) -> str:
+    return "[#3c3836]" + "\u2501" * width + "[/]"
+
+
+@lru_cache(maxsize=16)
+def _oldest_now_line(width: int) -> str:
+    return "[#928374]oldest[/]" + " " * max(1, width - 12) + "[#928374]now[/]"
+
+
+def _rasterize(grid: list[bytearray], ys: list[int], line_code: int, dot_code: int) -> None:
+    """Draw one series into the code grid, marking cells already holding a line as collisions.
+
+    Rows from _rows_from_vals are always in range and each segment spans columns
+    x-1..x, so the walk needs no clamping. Stepping one row at a time, a segment's
+    i-th cell is row y0 + i*dir, and it moves to column x once past the midpoint.
+    """
+    if not ys:
+        return
+    line_min = _LINE_MIN
+    for x in range(1, len(ys)):
+        y0 = ys[x - 1]
+        y1 = ys[x]
+        d = (y1 > y0) - (y1 < y0)
+        steps = abs(y1 - y0) or 1
+        for i in range(steps + 1):
+            xi = x if i * 2 > steps else x - 1
+            row = grid[y0 + d * i]
+            row[xi] = line_code if row[xi] < line_min else _COLLISION
+        row = grid[y1]
+        row[x] = dot_code if row[x] < line_min else _COLLISION
+
+    row = grid[ys[0]]
+    row[0] = dot_code if row[0] < line_min else _COLLISION
+
 
 class OddsChart(Static):
 
@@ -27,113 +130,74 @@ class OddsChart(Static):
     OddsChart .panel-body {
         height: 1fr;
     }
-    OddsChart .chart-footer {
-        height: 1;
-        color: #928374;
-    }
     """
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
-        self._yes: deque[float] = deque(maxlen=180)
-        self._no: deque[float] = deque(maxlen=180)
-        self._yes.append(50.0)
-        self._no.append(50.0)
+        self._yes = _Ring(_HISTORY_LEN)
+        self._no = _Ring(_HISTORY_LEN)
+        self._yes.push(50.0)
+        self._no.push(50.0)
+        # Everything the last render depended on; an equal signature means nothing to redraw.
+        self._render_sig: tuple | None = None
+        # Last text pushed to each child Static; identical text is not re-sent.
+        self._last_title = ""
+        self._last_body = ""
 
     def compose(self) -> ComposeResult:
         yield Static("[bold #83a598]ODDS[/]  [#928374](historical %)[/]", classes="panel-title", id="odds-title")
         yield Static("", classes="panel-body", id="odds-body")
-        yield Static("", classes="chart-footer", id="odds-footer")
 
-    def _resample(self, vals: list[float], width: int) -> list[float]:
+    def on_mount(self) -> None:
+        self._title = self.query_one("#odds-title", Static)
+        self._body = self.query_one("#odds-body", Static)
+
+    def _resample(self, vals: Sequence[float], width: int) -> Sequence[float]:
         if not vals:
             return []
         if len(vals) <= width:
             return vals
-        out: list[float] = []
-        for i in range(width):
-            idx = int(round(i * (len(vals) - 1) / max(1, width - 1)))
-            out.append(vals[idx])
-        return out
+        return [vals[i] for i in _resample_idx(len(vals), width)]
 
-    def _to_row(self, v: float, height: int) -> int:
+    def _rows_from_vals(self, vals: Sequence[float], height: int) -> list[int]:
         # Fixed 0..100 scale for comparability between snapshots.
-        v = max(0.0, min(100.0, v))
-        y = int(round((v / 100.0) * (height - 1)))
-        return (height - 1) - y
-
-    def _plot_series(
-        self,
-        grid: list[list[str]],
-        vals: list[float],
-        color: str,
-        mark: str,
-    ) -> None:
-        h = len(grid)
-        w = len(grid[0]) if h else 0
-        if not vals or w <= 0 or h <= 0:
-            return
-        pts = self._resample(vals, w)
-        ys = [self._to_row(v, h) for v in pts]
-
-        for x in range(1, len(ys)):
-            y0 = ys[x - 1]
-            y1 = ys[x]
-            steps = max(1, abs(y1 - y0))
-            for i in range(steps + 1):
-                xi = x - 1 + int(round(i / steps))
-                yi = int(round(y0 + (y1 - y0) * (i / steps)))
-                xi = max(0, min(w - 1, xi))
-                yi = max(0, min(h - 1, yi))
-                token = f"[{color}]{mark}[/]"
-                cell = grid[yi][xi]
-                if cell not in (" ", "[#504945]\u00b7[/]", "[#3c3836]\u00b7[/]"):
-                    token = "[bright_white]\u25c6[/]"
-                grid[yi][xi] = token
-            end_token = f"[{color}]\u25cf[/]"
-            end_cell = grid[y1][x]
-            if end_cell not in (" ", "[#504945]\u00b7[/]", "[#3c3836]\u00b7[/]"):
-                end_token = "[bright_white]\u25c6[/]"
-            grid[y1][x] = end_token
-
-        y_start = ys[0]
-        start_token = f"[{color}]\u25cf[/]"
-        start_cell = grid[y_start][0]
-        if start_cell not in (" ", "[#504945]\u00b7[/]", "[#3c3836]\u00b7[/]"):
-            start_token = "[bright_white]\u25c6[/]"
-        grid[y_start][0] = start_token
+        top = height - 1
+        return [
+            top - round(((0.0 if v < 0.0 else 100.0 if v > 100.0 else v) / 100.0) * top)
+            for v in vals
+        ]
 
     def _render_market_chart(
-        self, yes_vals: list[float], no_vals: list[float], width: int, height: int
+        self, yes_vals: Sequence[float], no_vals: Sequence[float], width: int, height: int
     ) -> list[str]:
         width = max(28, width)
         height = max(10, height)
-        grid = [[" " for _ in range(width)] for _ in range(height)]
+        grid = [bytearray(width) for _ in range(height)]
 
-        ticks = [0, 25, 50, 75, 100]
-        tick_rows = {self._to_row(t, height): t for t in ticks}
+        tick_rows = dict(zip(self._rows_from_vals(_TICKS, height), _TICKS))
         for r, t in tick_rows.items():
-            for x in range(width):
-                grid[r][x] = "[#504945]\u00b7[/]" if t not in (0, 100) else "[#3c3836]\u00b7[/]"
+            grid[r][:] = bytes((_DOT_MINOR if t not in (0, 100) else _DOT_EDGE,)) * width
+
+        # Resampling keeps the newest point last, so ys[-1] is also the endpoint row.
+        ys_yes = self._rows_from_vals(self._resample(yes_vals, width), height)
+        ys_no = self._rows_from_vals(self._resample(no_vals, width), height)
 
         # Distinct colors for immediate separation.
-        self._plot_series(grid, yes_vals, "#b8bb26", "\u2571")
-        self._plot_series(grid, no_vals, "#fb4934", "\u2572")
+        _rasterize(grid, ys_yes, _YES_LINE, _YES_DOT)
+        _rasterize(grid, ys_no, _NO_LINE, _NO_DOT)
 
         # Endpoint glow markers.
-        if yes_vals:
-            y = self._to_row(yes_vals[-1], height)
-            grid[y][-1] = "[#b8bb26]\u25cf[/]"
-        if no_vals:
-            y = self._to_row(no_vals[-1], height)
-            grid[y][-1] = "[#fb4934]\u25cf[/]"
+        if ys_yes:
+            grid[ys_yes[-1]][-1] = _YES_DOT
+        if ys_no:
+            grid[ys_no[-1]][-1] = _NO_DOT
 
         out: list[str] = []
         for r, row in enumerate(grid):
             axis = f"[#928374]{tick_rows[r]:>3}%[/]" if r in tick_rows else "    "
-            out.append("".join(row) + " " + axis)
-        out.append(f"[#3c3836]{'\u2501' * width}[/]")
-        out.append("[#928374]oldest[/]" + " " * max(1, width - 12) + "[#928374]now[/]")
+            out.append("".join([_TOKENS[c] for c in row]) + " " + axis)
+        out.append(_axis_separator(width))
+        out.append(_oldest_now_line(width))
         return out
 
     def update_odds(self, odds_view: dict) -> None:
@@ -143,38 +207,40 @@ class OddsChart(Static):
         no_now = float(odds_view.get("no_now", 0.0))
 
         if yes:
-            self._yes.clear()
-            self._yes.extend(float(v) for v in yes[-180:])
+            self._yes.replace(map(float, yes[-_HISTORY_LEN:]))
         elif yes_now > 0:
-            if not self._yes or abs(self._yes[-1] - yes_now) >= 0.01:
-                self._yes.append(yes_now)
+            if not self._yes or abs(self._yes.last() - yes_now) >= 0.01:
+                self._yes.push(yes_now)
 
         if no:
-            self._no.clear()
-            self._no.extend(float(v) for v in no[-180:])
+            self._no.replace(map(float, no[-_HISTORY_LEN:]))
         elif no_now > 0:
-            if not self._no or abs(self._no[-1] - no_now) >= 0.01:
-                self._no.append(no_now)
+            if not self._no or abs(self._no.last() - no_now) >= 0.01:
+                self._no.push(no_now)
 
         q = odds_view.get("question", "")
-        yes_now = yes_now or float(self._yes[-1] if self._yes else 0.0)
-        no_now = no_now or float(self._no[-1] if self._no else 0.0)
+        yes_now = yes_now or (self._yes.last() if self._yes else 0.0)
+        no_now = no_now or (self._no.last() if self._no else 0.0)
         is_live = bool(odds_view.get("is_live", False))
         stale_age_s = float(odds_view.get("stale_age_s", 0.0))
         samples = int(odds_view.get("samples", 0))
 
-        self.query_one("#odds-title", Static).update(
-            f"[bold #83a598]ODDS[/]  [#b8bb26]YES {yes_now:5.2f}%[/]  [#fb4934]NO {no_now:5.2f}%[/]"
+        yes_vals = self._yes.snapshot()
+        no_vals = self._no.snapshot()
+        width = self.size.width - 9 if self.size.width > 14 else 56
+        sig = (
+            yes_vals, no_vals, width, yes_now, no_now, q, samples,
+            is_live, 0.0 if is_live else stale_age_s,
         )
+        if sig == self._render_sig:
+            return
+        self._render_sig = sig
 
-        yes_vals = list(self._yes)
-        no_vals = list(self._no)
         yes_first = yes_vals[0] if yes_vals else yes_now
         no_first = no_vals[0] if no_vals else no_now
         yes_dp = yes_now - yes_first
         no_dp = no_now - no_first
 
-        width = self.size.width - 9 if self.size.width > 14 else 56
         chart = self._render_market_chart(yes_vals, no_vals, width=width, height=10)
         feed = "[#b8bb26]LIVE[/]" if is_live else f"[#fabd2f]STALE {stale_age_s:.1f}s[/]"
         legend = (
@@ -183,5 +249,14 @@ class OddsChart(Static):
             f"{feed}  [#928374]{samples} samples[/]"
         )
 
-        self.query_one("#odds-body", Static).update("\n".join(chart + [legend]))
-        self.query_one("#odds-footer", Static).update(f"[#928374]{q[:64]}[/]")
+        title = f"[bold #83a598]ODDS[/]  [#b8bb26]YES {yes_now:5.2f}%[/]  [#fb4934]NO {no_now:5.2f}%[/]"
+        # The question line rides in the body Static rather than a third widget.
+        chart.append(legend)
+        chart.append(f"[#928374]{q[:64]}[/]")
+        body = "\n".join(chart)
+        if title != self._last_title:
+            self._last_title = title
+            self._title.update(title)
+        if body != self._last_body:
+            self._last_body = body
+            self._body.update(body)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from textual.app import ComposeResult
 from textual.widgets import Static, DataTable
 
@@ -14,6 +16,58 @@ _STATUS = {
     "CANCELLED": ("#928374", "\u2718"),
     "REJECTED":  ("#fb4934", "\u2716"),
 }
+_LIVE_STATUSES = frozenset(("OPEN", "PENDING", "PARTIAL"))
+
+# Finished markup per enumerated value, looked up instead of formatted per row.
+_STATUS_MARKUP = {k: f"[{c}]{ic}[/]" for k, (c, ic) in _STATUS.items()}
+_UNKNOWN_STATUS = "[#928374]?[/]"
+_SIDE_MARKUP = ("[#fb4934]\u25bc[/]", "[#b8bb26]\u25b2[/]")  # indexed by side == "BUY"
+_OUT_MARKUP = ("[#d3869b]N[/]", "[#83a598]Y[/]")  # indexed by outcome == "YES"
+
+# Pre-bound cell templates; latency and age are indexed by colour bucket.
+_ID_FMT = "[#928374]{}[/]".format
+_PRICE_FMT = "{:.4f}".format
+_QTY_FMT = "{:.1f}".format
+_LAT_FMTS = (
+    "[#b8bb26]{:.0f}[/]".format,
+    "[#fabd2f]{:.0f}[/]".format,
+    "[#fb4934]{:.0f}[/]".format,
+)
+_AGE_FMTS = (
+    "[#928374]{:.0f}s[/]".format,
+    "[#fabd2f]{:.0f}s[/]".format,
+    "[#fb4934]{:.0f}s[/]".format,
+)
+
+
+@lru_cache(maxsize=4096)
+def _format_row(
+    status: str, side: str, outcome: str, id_: str,
+    price: float, size: float, filled: float, lat: float,
+) -> tuple[str, ...]:
+    """Markup for every cell but age; orders that haven't changed reuse the same tuple."""
+    return (
+        _STATUS_MARKUP.get(status, _UNKNOWN_STATUS),
+        _ID_FMT(id_),
+        _SIDE_MARKUP[side == "BUY"],
+        _OUT_MARKUP[outcome == "YES"],
+        _PRICE_FMT(price),
+        _QTY_FMT(size),
+        _QTY_FMT(filled),
+        _LAT_FMTS[0 if lat < 100 else 1 if lat < 300 else 2](lat),
+    )
+
+
+@lru_cache(maxsize=256)
+def _format_title(total: int, live: int, fills: int, rejects: int) -> str:
+    parts = [f"\u25b9 [bold #83a598]ORDERS[/] {total}"]
+    if live:
+        parts.append(f"[#83a598]\u25ce{live}[/]")
+    if fills:
+        parts.append(f"[#b8bb26]\u2714{fills}[/]")
+    if rejects:
+        parts.append(f"[#fb4934]\u2716{rejects}[/]")
+    return "  ".join(parts)
 
 
 class OrderFeed(Static):
@@ -43,47 +97,49 @@ class OrderFeed(Static):
         yield DataTable(id="of-table")
 
     def on_mount(self) -> None:
-        t = self.query_one("#of-table", DataTable)
+        self._title = self.query_one("#of-title", Static)
+        self._table = t = self.query_one("#of-table", DataTable)
         t.cursor_type = "row"
         t.zebra_stripes = True
-        t.add_columns("\u25cf", "id", "\u2195", "out", "price", "size", "fill", "lat", "age")
+        self._columns = t.add_columns(
+            "\u25cf", "id", "\u2195", "out", "price", "size", "fill", "lat", "age"
+        )
+        # Last rendered cells per row; rows are keyed by position so only changed cells redraw.
+        self._rows: list[tuple[str, ...]] = []
 
     def update_orders(self, orders: list[dict]) -> None:
-        t = self.query_one("#of-table", DataTable)
-        t.clear()
-
-        live = sum(1 for o in orders if o["status"] in ("OPEN", "PENDING", "PARTIAL"))
-        fills = sum(1 for o in orders if o["status"] == "FILLED")
-        rejects = sum(1 for o in orders if o["status"] == "REJECTED")
-
-        parts = [f"\u25b9 [bold #83a598]ORDERS[/] {len(orders)}"]
-        if live:
-            parts.append(f"[#83a598]\u25ce{live}[/]")
-        if fills:
-            parts.append(f"[#b8bb26]\u2714{fills}[/]")
-        if rejects:
-            parts.append(f"[#fb4934]\u2716{rejects}[/]")
-        self.query_one("#of-title", Static).update("  ".join(parts))
-
+        live = fills = rejects = 0
+        for o in orders:
+            status = o["status"]
+            if status == "FILLED":
+                fills += 1
+            elif status == "REJECTED":
+                rejects += 1
+            elif status in _LIVE_STATUSES:
+                live += 1
+
+        self._title.update(_format_title(len(orders), live, fills, rejects))
+
+        rows: list[tuple[str, ...]] = []
         for o in reversed(orders):
-            color, icon = _STATUS.get(o["status"], ("#928374", "?"))
-            side = "[#b8bb26]\u25b2[/]" if o["side"] == "BUY" else "[#fb4934]\u25bc[/]"
-            out = "[#83a598]Y[/]" if o["outcome"] == "YES" else "[#d3869b]N[/]"
-
-            lat = o["latency_ms"]
-            lc = "#b8bb26" if lat < 100 else "#fabd2f" if lat < 300 else "#fb4934"
-
+            # Age ticks every second, so it is the one cell formatted per frame.
             age = o["age_s"]
-            ac = "#928374" if age < 5 else "#fabd2f" if age < 30 else "#fb4934"
-
-            t.add_row(
-                f"[{color}]{icon}[/]",
-                f"[#928374]{o['id']}[/]",
-                side,
-                out,
-                f"{o['price']:.4f}",
-                f"{o['size']:.1f}",
-                f"{o['filled']:.1f}",
-                f"[{lc}]{lat:.0f}[/]",
-                f"[{ac}]{age:.0f}s[/]",
-            )
+            rows.append(_format_row(
+                o["status"], o["side"], o["outcome"], o["id"],
+                o["price"], o["size"], o["filled"], o["latency_ms"],
+            ) + (_AGE_FMTS[0 if age < 5 else 1 if age < 30 else 2](age),))
+        self._sync_rows(self._table, rows)
+
+    def _sync_rows(self, t: DataTable, rows: list[tuple[str, ...]]) -> None:
+        old = self._rows
+        for i, (new, prev) in enumerate(zip(rows, old)):
+            if new == prev:
+                continue
+            for col, value, was in zip(self._columns, new, prev):
+                if value != was:
+                    t.update_cell(str(i), col, value, update_width=True)
+        for i in range(len(old) - 1, len(rows) - 1, -1):
+            t.remove_row(str(i))
+        for i in range(len(old), len(rows)):
+            t.add_row(*rows[i], key=str(i))
+        self._rows = rows
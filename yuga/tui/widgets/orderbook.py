@@ -2,11 +2,154 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from math import isfinite
+from operator import itemgetter
 
 from textual.app import ComposeResult
 from textual.widgets import Static
 
+_FULL = "\u2588"
+_SHADE = "\u2591"
+
+
+def _make_bars(color: str) -> tuple[str, ...]:
+    """Depth bar markup for every fill width 0..12; width 0 is the empty bar."""
+    bars = ["[#3c3836]" + _SHADE * 12 + "[/]"]
+    for width in range(1, 13):
+        bars.append(f"[{color}]{_FULL * (width - 1)}\u2593[/][#3c3836]{_SHADE * (12 - width)}[/]")
+    return tuple(bars)
+
+
+_ASK_BARS = _make_bars("#fb4934")
+_BID_BARS = _make_bars("#b8bb26")
+_ASK_LABEL = "[#fb4934]A[/]"
+_BID_LABEL = "[#b8bb26]B[/]"
+_DOTS = "\u2504" * 31
+_SEP_ASKS = f"[#504945] {_DOTS} asks {_DOTS}[/]"
+_SEP_BIDS = f"[#504945] {_DOTS} bids {_DOTS}[/]"
+_EMPTY_ROW = " [#928374]\u00b7  ---.---     ---.-    ---.-   --.-bp  " + "\u2591" * 12 + "[/]"
+_QUOTE_TAG = "[bold #fabd2f]  \u25c6Q[/]"
+_ROWS_PER_SIDE = 5
+_size = itemgetter(1)
+# Level row: side label, price, size, cumulative size, dmid text, depth bar, quote tag.
+# The best level (index 0) gets a brighter price.
+_ROW_FMTS = (
+    " {} [bold bright_white]{:>5.3f}[/]  [bright_white]{:>7.1f}[/]  [#928374]{:>7.1f}[/]  [#928374]{}bp[/]  {}{}".format,
+    " {} [bold]{:>5.3f}[/]  [bright_white]{:>7.1f}[/]  [#928374]{:>7.1f}[/]  [#928374]{}bp[/]  {}{}".format,
+)
+
+
+def _bar(size: float, max_size: float, bars: tuple[str, ...]) -> str:
+    if not isfinite(size) or size <= 0 or max_size <= 0:
+        return bars[0]
+    return bars[max(1, min(12, int(round((size / max_size) * 12))))]
+
+
+@lru_cache(maxsize=64)
+def _question_line(question: str) -> str:
+    return f"[bold]{question[:52]}[/]"
+
+
+@lru_cache(maxsize=64)
+def _market_suffix(market: str) -> str:
+    return f"  [#928374]\u2502 mkt {market[:14]}[/]"
+
+
+def _as_rows(levels, n: int) -> list[tuple[float, float]]:
+    """First n float (price, size) pairs from [(p, s), ...] or a columnar (prices, sizes) pair."""
+    if isinstance(levels, tuple):
+        prices, sizes = levels
+        return list(zip(map(float, prices[:n]), map(float, sizes[:n])))
+    return [(float(p), float(s)) for p, s in levels[:n]]
+
+
+def _max_size(levels) -> float:
+    """Largest size on the whole side; depth bars scale against full depth, not just shown rows."""
+    if isinstance(levels, tuple):
+        return max(map(float, levels[1]), default=0.0)
+    return max((float(s) for _, s in levels), default=0.0)
+
+
+def _fmt_side(
+    side: str,
+    shown: list[tuple[float, float]],
+    max_sz: float,
+    outcome: str,
+    mid: float | None,
+    qsets: dict[tuple[str, str], set[float]],
+    out: list[str],
+) -> None:
+    # shown rows are already float pairs (see _fmt_rows), so no per-level conversions here.
+    cum = 0.0
+    # Everything that depends only on the side is resolved once, outside the row loop.
+    is_ask = side == "ask"
+    side_label = _ASK_LABEL if is_ask else _BID_LABEL
+    bars = _ASK_BARS if is_ask else _BID_BARS
+    qprices = qsets.get((outcome, "SELL" if is_ask else "BUY"), ())
+    have_mid = bool(mid and mid > 0)
+    for idx, (p, s) in enumerate(shown):
+        cum += s
+        # With no live quotes on this side (the usual case) the probe is skipped entirely.
+        tag = _QUOTE_TAG if qprices and round(p, 3) in qprices else ""
+        bps_txt = f"{((p - mid) / mid) * 10000:+6.1f}" if have_mid else "--.-"
+        out.append(_ROW_FMTS[idx > 0](
+            side_label, p, s, cum, bps_txt, _bar(s, max_sz, bars), tag,
+        ))
+    pad = _ROWS_PER_SIDE - len(shown)
+    if pad > 0:
+        out.extend([_EMPTY_ROW] * pad)
+
+
+def _fmt_header(
+    outcome: str,
+    bids: list[tuple[float, float]],
+    asks: list[tuple[float, float]],
+    out: list[str],
+) -> float | None:
+    bb = bids[0][0] if bids else None
+    ba = asks[0][0] if asks else None
+    mid = (bb + ba) / 2 if bb is not None and ba is not None else None
+    spr = (ba - bb) if bb is not None and ba is not None else None
+    bid_top = sum(map(_size, bids))
+    ask_top = sum(map(_size, asks))
+    total_top = max(bid_top + ask_top, 0.0001)
+    buy_pct = (bid_top / total_top) * 100.0
+    bar_fill = int(round((buy_pct / 100.0) * 16))
+    bar_fill = max(0, min(16, bar_fill))
+    pressure = f"[#b8bb26]{_FULL * bar_fill}[/][#fb4934]{_FULL * (16 - bar_fill)}[/]"
+    out.append(f"[bold #83a598]{outcome}[/]  [#928374]px      size      cum      dmid      depth         quote[/]")
+    if bb is None or ba is None:
+        out.append("[#928374] bb ---.---         ba ---.---[/]")
+    else:
+        out.append(f"[#b8bb26] bb {bb:.3f}[/] [#928374]        [/][#fb4934]ba {ba:.3f}[/]")
+    if mid is None or spr is None:
+        out.append("[#928374] mid ---.---   spr ---.---   top5 b/a --.-/--.-[/]")
+    else:
+        out.append(
+            f"[bright_white] mid {mid:.3f}[/]   [bright_white]spr {spr:.3f}[/]   "
+            f"[#928374]top5 b/a {bid_top:.1f}/{ask_top:.1f} ({buy_pct:>4.1f}% b)[/] {pressure}"
+        )
+    return mid
+
+
+def _fmt_rows(
+    outcome: str,
+    bids: list | tuple,
+    asks: list | tuple,
+    qsets: dict[tuple[str, str], set[float]],
+    lines: list[str],
+) -> None:
+    """Append one outcome's header, asks and bids to lines."""
+    # Only the visible levels are converted; the header and rows never look past them.
+    bid_rows = _as_rows(bids, _ROWS_PER_SIDE)
+    ask_rows = _as_rows(asks, _ROWS_PER_SIDE)
+    mid = _fmt_header(outcome, bid_rows, ask_rows, lines)
+    lines.append(_SEP_ASKS)
+    _fmt_side("ask", ask_rows, _max_size(asks), outcome, mid, qsets, lines)
+    lines.append(_SEP_BIDS)
+    _fmt_side("bid", bid_rows, _max_size(bids), outcome, mid, qsets, lines)
+
 
 class OrderBookPanel(Static):
 
@@ -29,96 +172,25 @@ class OrderBookPanel(Static):
     }
     """
 
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        # Inputs of the last rendered frame; an identical visible book skips the rebuild.
+        self._last_key: tuple | None = None
+        self._last_text = ""
+
     def compose(self) -> ComposeResult:
         yield Static("[bold #83a598]ORDERBOOK[/]  [#504945]\u2502[/]  [#928374]DEPTH VIEW[/]", classes="panel-title")
         yield Static("", classes="panel-body", id="ob-body")
 
+    def on_mount(self) -> None:
+        self._body = self.query_one("#ob-body", Static)
+
     def update_book(self, view: dict) -> None:
         if not view or not view.get("market_id"):
-            self.query_one("#ob-body", Static).update("[#928374]waiting for books...[/]")
+            self._last_key = None
+            self._set_body("[#928374]waiting for books...[/]")
             return
 
-        quotes = view.get("quotes", [])
-        qset = {(q["outcome"], q["side"], round(q["price"], 3)) for q in quotes}
-        rows_per_side = 5
-
-        def _bar(size: float, max_size: float, side: str) -> str:
-            if not isfinite(size) or size <= 0 or max_size <= 0:
-                return "[#3c3836]\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591[/]"
-            width = max(1, min(12, int(round((size / max_size) * 12))))
-            color = "#fb4934" if side == "ask" else "#b8bb26"
-            blocks = "\u2588" * max(0, width - 1) + "\u2593" if width > 0 else ""
-            rest = "\u2591" * (12 - width)
-            return f"[{color}]{blocks}[/][#3c3836]{rest}[/]"
-
-        def _fmt_side(
-            side: str,
-            rows: list[tuple[float, float]],
-            outcome: str,
-            mid: float | None,
-        ) -> list[str]:
-            max_sz = max((float(s) for _, s in rows), default=0.0)
-            out: list[str] = []
-            shown = rows[:rows_per_side]
-            cum = 0.0
-            for idx, (p, s) in enumerate(shown):
-                cum += float(s)
-                quote_side = "SELL" if side == "ask" else "BUY"
-                tag = "[bold #fabd2f]  \u25c6Q[/]" if (outcome, quote_side, round(p, 3)) in qset else ""
-                side_label = "[#fb4934]A[/]" if side == "ask" else "[#b8bb26]B[/]"
-                bps_txt = "--.-"
-                if mid and mid > 0:
-                    bps = ((p - mid) / mid) * 10000
-                    bps_txt = f"{bps:+6.1f}"
-                px_fmt = f"[bold bright_white]{p:>5.3f}[/]" if idx == 0 else f"[bold]{p:>5.3f}[/]"
-                out.append(
-                    f" {side_label} {px_fmt}  "
-                    f"[bright_white]{s:>7.1f}[/]  [#928374]{cum:>7.1f}[/]  "
-                    f"[#928374]{bps_txt}bp[/]  {_bar(float(s), max_sz, side)}{tag}"
-                )
-            for _ in range(rows_per_side - len(shown)):
-                out.append(" [#928374]\u00b7  ---.---     ---.-    ---.-   --.-bp  \u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591[/]")
-            return out
-
-        def _fmt_header(
-            outcome: str, bids: list[tuple[float, float]], asks: list[tuple[float, float]]
-        ) -> list[str]:
-            bb = bids[0][0] if bids else None
-            ba = asks[0][0] if asks else None
-            mid = (bb + ba) / 2 if bb is not None and ba is not None else None
-            spr = (ba - bb) if bb is not None and ba is not None else None
-            bid_top = sum(s for _, s in bids[:rows_per_side])
-            ask_top = sum(s for _, s in asks[:rows_per_side])
-            total_top = max(bid_top + ask_top, 0.0001)
-            buy_pct = (bid_top / total_top) * 100.0
-            bar_fill = int(round((buy_pct / 100.0) * 16))
-            bar_fill = max(0, min(16, bar_fill))
-            pressure = f"[#b8bb26]{'\u2588' * bar_fill}[/][#fb4934]{'\u2588' * (16 - bar_fill)}[/]"
-            header = [f"[bold #83a598]{outcome}[/]  [#928374]px      size      cum      dmid      depth         quote[/]"]
-            if bb is None or ba is None:
-                header.append("[#928374] bb ---.---         ba ---.---[/]")
-            else:
-                header.append(f"[#b8bb26] bb {bb:.3f}[/] [#928374]        [/][#fb4934]ba {ba:.3f}[/]")
-            if mid is None or spr is None:
-                header.append("[#928374] mid ---.---   spr ---.---   top5 b/a --.-/--.-[/]")
-            else:
-                header.append(
-                    f"[bright_white] mid {mid:.3f}[/]   [bright_white]spr {spr:.3f}[/]   "
-                    f"[#928374]top5 b/a {bid_top:.1f}/{ask_top:.1f} ({buy_pct:>4.1f}% b)[/] {pressure}"
-                )
-            return header, mid
-
-        def fmt_rows(outcome: str, bids: list, asks: list) -> list[str]:
-            bid_rows = [(float(p), float(s)) for p, s in bids]
-            ask_rows = [(float(p), float(s)) for p, s in asks]
-            header, mid = _fmt_header(outcome, bid_rows, ask_rows)
-            lines = header
-            lines.append("[#504945] \u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504 asks \u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504[/]")
-            lines += _fmt_side("ask", ask_rows, outcome, mid)
-            lines.append("[#504945] \u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504 bids \u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504[/]")
-            lines += _fmt_side("bid", bid_rows, outcome, mid)
-            return lines
-
         market = view.get("market_id", "")
         mode = view.get("rotate_mode", "MANUAL")
         pos = int(view.get("book_pos", 0))
@@ -134,14 +206,41 @@ class OrderBookPanel(Static):
             status_line = (
                 f"[#fabd2f]STALE[/] [#928374]{view.get('stale_age_s', 0.0):.1f}s old \u2502 searching refresh...[/]"
             )
+        question = view.get("question", "")
+        yes_bids = view.get("yes_bids", [])
+        yes_asks = view.get("yes_asks", [])
+        no_bids = view.get("no_bids", [])
+        no_asks = view.get("no_asks", [])
+        quotes = view.get("quotes", [])
+
+        # Fingerprint of the raw inputs, checked before any per-level work. Lists are
+        # compared by value: views are rebuilt per snapshot, so identity would never hit.
+        key = (
+            question, market, status_line, nav_line, quotes,
+            yes_bids, yes_asks, no_bids, no_asks,
+        )
+        if key == self._last_key:
+            return
+        self._last_key = key
+
+        # (outcome, side) -> quoted prices at tick precision; rows probe a bare float.
+        qsets: dict[tuple[str, str], set[float]] = {}
+        for q in quotes:
+            qsets.setdefault((q["outcome"], q["side"]), set()).add(round(q["price"], 3))
+
         lines: list[str] = [
-            f"[bold]{view.get('question', '')[:52]}[/]",
-            f"{status_line}  [#928374]\u2502 mkt {market[:14]}[/]",
+            _question_line(question),
+            status_line + _market_suffix(market),
             nav_line,
             "",
         ]
-        lines += fmt_rows("YES", view.get("yes_bids", []), view.get("yes_asks", []))
+        _fmt_rows("YES", yes_bids, yes_asks, qsets, lines)
         lines.append("")
-        lines += fmt_rows("NO", view.get("no_bids", []), view.get("no_asks", []))
+        _fmt_rows("NO", no_bids, no_asks, qsets, lines)
+
+        self._set_body("\n".join(lines))
 
-        self.query_one("#ob-body", Static).update("\n".join(lines))
+    def _set_body(self, text: str) -> None:
+        if text != self._last_text:
+            self._last_text = text
+            self._body.update(text)
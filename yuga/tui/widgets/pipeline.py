@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from textual.app import ComposeResult
 from textual.widgets import Static
 
@@ -16,31 +18,43 @@ _STAGES = [
 
 _STAGE_NAMES = [s[0] for s in _STAGES]
 
+# Stage labels and connectors in each state, rendered once at import.
+_PARTS_DONE = tuple(f"[#b8bb26]{icon} {label}[/]" for _, icon, label in _STAGES)
+_PARTS_ACTIVE = tuple(f"[bold #83a598 on #83a598 15%] {icon} {label} [/]" for _, icon, label in _STAGES)
+_PARTS_IDLE = tuple(f"[#928374]{icon} {label}[/]" for _, icon, label in _STAGES)
+_CONN_DONE = "[#b8bb26]\u2501\u2501\u25b8[/]"
+_CONN_ACTIVE = "[#fabd2f]\u2501\u2501\u25b8[/]"
+_CONN_IDLE = "[#504945]\u2501\u2501\u25b8[/]"
+
+_STATS_FMT = (
+    "\u26a1 [#fabd2f]{}[/] [#928374]q[/]  [#504945]\u2502[/]  "
+    "\u25ce [#83a598]{}[/] [#928374]cyc[/]  [#504945]\u2502[/]  "
+    "\u25c8 {} [#928374]scans[/]  [#504945]\u2502[/]  "
+    "\u2714 [#b8bb26]{}[/] [#928374]sent[/]  [#504945]\u2502[/]  "
+    "\u25c9 {}[#928374]/{} mkts[/]"
+).format
+
 
+@lru_cache(maxsize=16)
 def _build_pipeline(active: str, paused: bool) -> str:
-    parts: list[str] = []
-    active_idx = _STAGE_NAMES.index(active) if active in _STAGE_NAMES else -1
+    # Paused renders exactly like "no active stage": every label and connector idle.
+    active_idx = _STAGE_NAMES.index(active) if active in _STAGE_NAMES and not paused else -1
 
-    for i, (name, icon, label) in enumerate(_STAGES):
-        if paused:
-            parts.append(f"[#928374]{icon} {label}[/]")
+    result: list[str] = []
+    last = len(_STAGES) - 1
+    for i in range(len(_STAGES)):
+        if i < active_idx:
+            result.append(_PARTS_DONE[i])
+            if i < last:
+                result.append(_CONN_DONE)
         elif i == active_idx:
-            parts.append(f"[bold #83a598 on #83a598 15%] {icon} {label} [/]")
-        elif i < active_idx:
-            parts.append(f"[#b8bb26]{icon} {label}[/]")
+            result.append(_PARTS_ACTIVE[i])
+            if i < last:
+                result.append(_CONN_ACTIVE)
         else:
-            parts.append(f"[#928374]{icon} {label}[/]")
-
-    result: list[str] = []
-    for i, part in enumerate(parts):
-        result.append(part)
-        if i < len(parts) - 1:
-            if not paused and i < active_idx:
-                result.append("[#b8bb26]\u2501\u2501\u25b8[/]")
-            elif not paused and i == active_idx:
-                result.append("[#fabd2f]\u2501\u2501\u25b8[/]")
-            else:
-                result.append("[#504945]\u2501\u2501\u25b8[/]")
+            result.append(_PARTS_IDLE[i])
+            if i < last:
+                result.append(_CONN_IDLE)
 
     return "".join(result)
 
@@ -76,6 +90,18 @@ class PipelinePanel(Static):
         yield Static("", classes="pipe-vis", id="pipe-vis")
         yield Static("", classes="pipe-stats", id="pipe-stats")
 
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        # Last text pushed to each child Static; identical text is not re-sent.
+        self._last_title = ""
+        self._last_vis = ""
+        self._last_stats = ""
+
+    def on_mount(self) -> None:
+        self._title = self.query_one("#pipe-title", Static)
+        self._vis = self.query_one("#pipe-vis", Static)
+        self._stats = self.query_one("#pipe-stats", Static)
+
     def update_pipeline(self, stage: str, mm_stats: dict, exec_stats: dict,
                         recent_orders: list[dict] | None = None) -> None:
         paused = exec_stats.get("paused", False)
@@ -85,11 +111,14 @@ class PipelinePanel(Static):
         else:
             indicator = f"[#b8bb26]\u25b6[/] {stage.lower()}"
 
-        self.query_one("#pipe-title", Static).update(
-            f"\u25c8 [bold #83a598]PIPELINE[/]  {indicator}"
-        )
-
-        self.query_one("#pipe-vis", Static).update(_build_pipeline(stage, paused))
+        title = f"\u25c8 [bold #83a598]PIPELINE[/]  {indicator}"
+        if title != self._last_title:
+            self._last_title = title
+            self._title.update(title)
+        vis = _build_pipeline(stage, paused)
+        if vis != self._last_vis:
+            self._last_vis = vis
+            self._vis.update(vis)
 
         quotes = mm_stats.get("active_quotes", 0)
         scans = mm_stats.get("total_scans", 0)
@@ -98,13 +127,8 @@ class PipelinePanel(Static):
         markets_ready = mm_stats.get("markets_ready", 0)
         markets_total = mm_stats.get("markets_tracked", 0)
 
-        sep = "[#504945]\u2502[/]"
-        stats = (
-            f"\u26a1 [#fabd2f]{quotes}[/] [#928374]q[/]  {sep}  "
-            f"\u25ce [#83a598]{cycles}[/] [#928374]cyc[/]  {sep}  "
-            f"\u25c8 {scans} [#928374]scans[/]  {sep}  "
-            f"\u2714 [#b8bb26]{total_quotes}[/] [#928374]sent[/]  {sep}  "
-            f"\u25c9 {markets_ready}[#928374]/{markets_total} mkts[/]"
-        )
+        stats = _STATS_FMT(quotes, cycles, scans, total_quotes, markets_ready, markets_total)
 
-        self.query_one("#pipe-stats", Static).update(stats)
+        if stats != self._last_stats:
+            self._last_stats = stats
+            self._stats.update(stats)
@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
-from collections import deque
+from array import array
+from math import copysign
+from operator import itemgetter
 
 from textual.app import ComposeResult
 from textual.widgets import Static, Sparkline
 
+_C_GREEN = "#b8bb26"
+_C_RED = "#fb4934"
+
+_HISTORY_LEN = 120
+_value = itemgetter(1)
+
+_TITLE_FMT = "\u25c8 [bold #83a598]PNL[/]  [{}]{} ${:+.4f}[/]".format
+_FOOTER_FMT = "[#928374]\u2714 {}/{}  \u25ce {:.0f}%[/]".format
+
 
 class PnLChart(Static):
 
@@ -36,36 +47,69 @@ class PnLChart(Static):
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
-        self._data: deque[float] = deque(maxlen=120)
-        self._data.append(0.0)
+        # The sparkline holds this same unboxed buffer; it is refilled in place rather than copied.
+        self._data = array("d", (0.0,))
+        # Newest history sample already in the buffer; later ticks only append what follows it.
+        self._last_sample: tuple[float, float] | None = None
+        self._last_key: tuple | None = None
 
     def compose(self) -> ComposeResult:
         yield Static("\u25c8 [bold #83a598]PNL[/]", classes="panel-title", id="pnl-title")
-        yield Sparkline(list(self._data), id="pnl-spark")
+        yield Sparkline(self._data, id="pnl-spark")
         yield Static("", classes="chart-footer", id="pnl-footer")
 
+    def on_mount(self) -> None:
+        self._title = self.query_one("#pnl-title", Static)
+        self._spark = self.query_one("#pnl-spark", Sparkline)
+        self._footer = self.query_one("#pnl-footer", Static)
+
+    def _new_samples(
+        self, pnl_history: list[tuple[float, float]]
+    ) -> list[tuple[float, float]] | None:
+        """Samples after the last one buffered, or None if it has left the history."""
+        last = self._last_sample
+        if last is not None:
+            for i in range(len(pnl_history) - 1, -1, -1):
+                if pnl_history[i] is last:
+                    return pnl_history[i + 1:]
+        return None
+
     def update_pnl(self, pnl_history: list[tuple[float, float]], exec_stats: dict) -> None:
+        data = self._data
+        changed = True
         if pnl_history:
-            self._data.clear()
-            for _, v in pnl_history[-120:]:
-                self._data.append(v)
+            new = self._new_samples(pnl_history)
+            keep = min(len(pnl_history), _HISTORY_LEN)
+            if new is None or len(data) + len(new) < keep:
+                del data[:]
+                data.extend(map(_value, pnl_history[-_HISTORY_LEN:]))
+            elif new or len(data) > keep:
+                # Append-only history: buffer + new tail always ends in its current window.
+                data.extend(map(_value, new[-_HISTORY_LEN:]))
+                del data[:len(data) - keep]
+            else:
+                changed = False
+            self._last_sample = pnl_history[-1]
+        elif len(data) <= 1:
+            data.append(exec_stats.get("cumulative_pnl", 0))
+            self._last_sample = None
         else:
-            val = exec_stats.get("cumulative_pnl", 0)
-            if len(self._data) <= 1:
-                self._data.append(val)
+            changed = False
 
-        self.query_one("#pnl-spark", Sparkline).data = list(self._data)
+        if changed:
+            self._spark.mutate_reactive(Sparkline.data)
 
         pnl = exec_stats.get("cumulative_pnl", 0)
-        pc = "#b8bb26" if pnl >= 0 else "#fb4934"
-        icon = "\u25b2" if pnl >= 0 else "\u25bc"
         fills = exec_stats.get("total_fills", 0)
         orders = exec_stats.get("total_orders", 0)
         fr = exec_stats.get("fill_rate", 0)
+        # Signs kept in the key: 0.0 == -0.0, but they render as $+0.0000 and $-0.0000.
+        key = (pnl, fills, orders, fr, copysign(1.0, pnl), copysign(1.0, fr))
+        if key == self._last_key:
+            return
+        self._last_key = key
 
-        self.query_one("#pnl-title", Static).update(
-            f"\u25c8 [bold #83a598]PNL[/]  [{pc}]{icon} ${pnl:+.4f}[/]"
-        )
-        self.query_one("#pnl-footer", Static).update(
-            f"[#928374]\u2714 {fills}/{orders}  \u25ce {fr:.0f}%[/]"
-        )
+        pc = _C_GREEN if pnl >= 0 else _C_RED
+        icon = "\u25b2" if pnl >= 0 else "\u25bc"
+        self._title.update(_TITLE_FMT(pc, icon, pnl))
+        self._footer.update(_FOOTER_FMT(fills, orders, fr))
@@ -2,22 +2,136 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from math import copysign
+from operator import itemgetter
+
 from textual.app import ComposeResult
 from textual.widgets import Static
 
+_C_GREEN = "#b8bb26"
+_C_RED = "#fb4934"
+_C_AMBER = "#fabd2f"
+_C_DIM = "#928374"
+_C_ACCENT = "#83a598"
+
+# Indexed by the codes from _frame_codes: sign is (down, up), grade is (bad, fair, good).
+_SIGN_STYLES = ((_C_RED, "\u25bc"), (_C_GREEN, "\u25b2"))
+_GRADE_COLORS = (_C_RED, _C_AMBER, _C_GREEN)
+
+_FULL = "\u2588"
+_SHADE = "\u2591"
+
+
+@lru_cache(maxsize=128)
+def _bar_cached(filled: int, width: int, color: str) -> str:
+    blocks = _FULL * max(0, filled - 1) + "\u2593" if filled > 0 else ""
+    return f"[{color}]{blocks}[/][#3c3836]{_SHADE * (width - filled)}[/]"
+
+
+# Idle bars by width: no limit configured, nothing used, and limit reached.
+_BAR_WIDTHS = (5, 8, 10)
+_NO_LIMIT_BARS = {w: "[#3c3836]" + _SHADE * w + "[/]" for w in _BAR_WIDTHS}
+_EMPTY_BARS = {w: _bar_cached(0, w, _C_GREEN) for w in _BAR_WIDTHS}
+_FULL_BARS = {w: _bar_cached(w, w, _C_RED) for w in _BAR_WIDTHS}
+
 
 def _bar(value: float, max_val: float, width: int = 10) -> str:
     if max_val <= 0:
-        return "[#3c3836]" + "\u2591" * width + "[/]"
+        return _NO_LIMIT_BARS[width]
+    if value == 0:
+        return _EMPTY_BARS[width]
+    if abs(value) >= max_val:
+        return _FULL_BARS[width]
     ratio = min(abs(value) / max_val, 1.0)
-    filled = int(ratio * width)
-    c = "#fb4934" if ratio > 0.8 else "#fabd2f" if ratio > 0.5 else "#b8bb26"
-    blocks = "\u2588" * max(0, filled - 1) + "\u2593" if filled > 0 else ""
-    return f"[{c}]{blocks}[/][#3c3836]{'\u2591' * (width - filled)}[/]"
-
-
-def _kv(icon: str, label: str, value: str) -> str:
-    return f"  {icon} [#928374]{label}[/] {value}"
+    c = _C_RED if ratio > 0.8 else _C_AMBER if ratio > 0.5 else _C_GREEN
+    return _bar_cached(int(ratio * width), width, c)
+
+
+_STREAK_MAX = 5
+# Loss streaks are small non-negative ints on a fixed scale, so every bar is known up front.
+_STREAK_BARS = tuple(_bar(n, _STREAK_MAX, 5) for n in range(_STREAK_MAX + 1))
+
+
+def _streak_bar(consec: int) -> str:
+    if type(consec) is int and consec >= 0:
+        return _STREAK_BARS[min(consec, _STREAK_MAX)]
+    return _bar(consec, _STREAK_MAX, 5)
+
+
+# Stats keys with their fallbacks, in the order update_state unpacks them.
+_EXEC_DEFAULTS = {
+    "cumulative_pnl": 0, "spread_capture_pnl": 0, "liquidity_rewards": 0,
+    "total_fills": 0, "total_orders": 0, "total_rejects": 0, "total_cancels": 0,
+    "fill_rate": 0, "avg_latency_ms": 0,
+}
+_RISK_DEFAULTS = {
+    "daily_pnl": 0, "circuit_breaker_active": False, "consecutive_losses": 0,
+    "max_daily_loss": 50, "circuit_breaker_remaining_s": 0, "circuit_breaker_reason": "",
+}
+_exec_fields = itemgetter(*_EXEC_DEFAULTS)
+_risk_fields = itemgetter(*_RISK_DEFAULTS)
+
+
+def _fields(d: dict, getter: itemgetter, defaults: dict) -> tuple:
+    """All fields in one C-level lookup; falls back to per-key defaults for partial dicts."""
+    try:
+        return getter(d)
+    except KeyError:
+        return tuple(d.get(k, v) for k, v in defaults.items())
+
+
+def _signs(*vals: float) -> tuple[float, ...]:
+    """copysign(1.0, v) per value; keys need it because 0.0 == -0.0 but they render apart."""
+    return tuple([copysign(1.0, v) for v in vals])
+
+
+def _frame_codes(pnl: float, daily: float, fr: float, lat: float) -> tuple[int, int, int, int]:
+    """Sign codes for pnl/daily and grade codes for fill rate/latency."""
+    return pnl >= 0, daily >= 0, (fr > 70) + (fr > 40), (lat < 100) + (lat < 300)
+
+
+def _kv(icon: str, label: str) -> str:
+    return f"  {icon} [{_C_DIM}]{label}[/] "
+
+
+_SEP_LINE = "[#504945]  " + "\u2504" * 27 + "[/]"
+# Row prefixes keyed by label; values are appended per refresh.
+_KV_PREFIXES = {
+    "orders": _kv("\u2660", "orders "),
+    "fills": _kv("\u2714", "fills  "),
+    "rate": _kv("\u25ce", "rate   "),
+    "lat": _kv("\u25d0", "lat    "),
+    "breaker": _kv("\u26a1", "breaker"),
+    "streak": _kv("\u2620", "streak "),
+    "daily": _kv("\u25c6", "daily  "),
+}
+_BREAKER_OK = _KV_PREFIXES["breaker"] + f"[{_C_GREEN}]\u25cf ok[/]"
+_INVENTORY_HEADER = f"  [bold {_C_ACCENT}]inventory[/]"
+
+# Per-refresh rows as pre-bound templates; only the numbers vary.
+_PNL_LINE_FMT = "  [{0}]{1}[/] [bold {0}]${2:+.4f}[/]  [#928374]all-time[/]".format
+_DAILY_LINE_FMT = "  [{0}]{1}[/] [{0}]${2:+.4f}[/]  [#928374]today[/]".format
+_SPREAD_LINE_FMT = "  [#83a598]\u25ce[/] [#83a598]${:+.4f}[/] [#928374]spread[/]".format
+_REBATES_LINE_FMT = "  [#fabd2f]\u26a1[/] [#fabd2f]${:+.4f}[/] [#928374]rebates[/]".format
+_ORDERS_FMT = (_KV_PREFIXES["orders"] + "{}").format
+_FILLS_FMT = (
+    _KV_PREFIXES["fills"]
+    + "[#b8bb26]{}[/]  [#928374]\u2716[/][#fb4934]{}[/]  [#928374]\u2718[/][#928374]{}[/]"
+).format
+_RATE_FMT = (_KV_PREFIXES["rate"] + "[{}]{:.0f}%[/]  {}").format
+_LAT_FMT = (_KV_PREFIXES["lat"] + "[{}]{:.0f}ms[/]").format
+_BREAKER_TRIPPED_FMT = "  [bold #fb4934]\u26a0 BREAKER TRIPPED[/] [#928374]{:.0f}s[/]".format
+_BREAKER_REASON_FMT = "    [#fb4934]{}[/]".format
+_STREAK_FMT = (_KV_PREFIXES["streak"] + "{}[#928374]/5[/]  {}").format
+_DAILY_LOSS_FMT = (_KV_PREFIXES["daily"] + "{} [#928374]${:.1f}/${:.0f}[/]").format
+_INV_ROW_FMT = "  [#928374]{}[/] {:<3} [#83a598]{:+.1f}[/]".format
+
+
+@lru_cache(maxsize=64)
+def _inv_row(cid6: str, outcome: str, size: float, sign: float) -> str:
+    # sign is copysign(1.0, size): 0.0 and -0.0 hash alike but render as +0.0 and -0.0.
+    return _INV_ROW_FMT(cid6, outcome, size)
 
 
 class PositionsPanel(Static):
@@ -41,74 +155,71 @@ class PositionsPanel(Static):
     }
     """
 
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        # Inputs behind the last render; identical refreshes skip formatting entirely.
+        self._last_key: tuple | None = None
+
     def compose(self) -> ComposeResult:
         yield Static("\u25c8 [bold #83a598]RISK & PNL[/]", classes="panel-title")
         yield Static("", classes="panel-body", id="risk-body")
 
+    def on_mount(self) -> None:
+        self._body = self.query_one("#risk-body", Static)
+
     def update_state(self, exec_stats: dict, risk: dict, inventory: list[dict]) -> None:
-        pnl = exec_stats.get("cumulative_pnl", 0)
-        daily = risk.get("daily_pnl", 0)
-        pc = "#b8bb26" if pnl >= 0 else "#fb4934"
-        dc = "#b8bb26" if daily >= 0 else "#fb4934"
-        pnl_icon = "\u25b2" if pnl >= 0 else "\u25bc"
-        spread_pnl = exec_stats.get("spread_capture_pnl", 0)
-        rebates = exec_stats.get("liquidity_rewards", 0)
-
-        fills = exec_stats.get("total_fills", 0)
-        orders = exec_stats.get("total_orders", 0)
-        rejects = exec_stats.get("total_rejects", 0)
-        cancels = exec_stats.get("total_cancels", 0)
-        fr = exec_stats.get("fill_rate", 0)
-        lat = exec_stats.get("avg_latency_ms", 0)
-        fc = "#b8bb26" if fr > 70 else "#fabd2f" if fr > 40 else "#fb4934"
-        lc = "#b8bb26" if lat < 100 else "#fabd2f" if lat < 300 else "#fb4934"
-
-        cb = risk.get("circuit_breaker_active", False)
-        consec = risk.get("consecutive_losses", 0)
-        max_loss = risk.get("max_daily_loss", 50)
-
-        lines = [
-            f"  [{pc}]{pnl_icon}[/] [bold {pc}]${pnl:+.4f}[/]  [#928374]all-time[/]",
-            f"  [{dc}]{'\u25b2' if daily >= 0 else '\u25bc'}[/] [{dc}]${daily:+.4f}[/]  [#928374]today[/]",
-            f"  [#83a598]\u25ce[/] [#83a598]${spread_pnl:+.4f}[/] [#928374]spread[/]",
-            f"  [#fabd2f]\u26a1[/] [#fabd2f]${rebates:+.4f}[/] [#928374]rebates[/]",
-            "[#504945]  \u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504[/]",
-            _kv("\u2660", "orders ", f"{orders}"),
-            _kv("\u2714", "fills  ", f"[#b8bb26]{fills}[/]  "
-                f"[#928374]\u2716[/][#fb4934]{rejects}[/]  "
-                f"[#928374]\u2718[/][#928374]{cancels}[/]"),
-            _kv("\u25ce", "rate   ", f"[{fc}]{fr:.0f}%[/]  {_bar(fr, 100, 8)}"),
-            _kv("\u25d0", "lat    ", f"[{lc}]{lat:.0f}ms[/]"),
-            "[#504945]  \u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504\u2504[/]",
-        ]
+        (pnl, spread_pnl, rebates, fills, orders, rejects, cancels,
+         fr, lat) = _fields(exec_stats, _exec_fields, _EXEC_DEFAULTS)
+        daily, cb, consec, max_loss, rem, reason = _fields(risk, _risk_fields, _RISK_DEFAULTS)
+        if not cb:
+            rem, reason = 0, ""
+        inv_rows = tuple(
+            (row.get("condition_id", ""), row.get("outcome", ""), row.get("size", 0))
+            for row in inventory[:6]
+        )
 
-        if cb:
-            rem = risk.get("circuit_breaker_remaining_s", 0)
-            reason = risk.get("circuit_breaker_reason", "")
-            lines.append(f"  [bold #fb4934]\u26a0 BREAKER TRIPPED[/] [#928374]{rem:.0f}s[/]")
-            lines.append(f"    [#fb4934]{reason}[/]")
-        else:
-            lines.append(_kv("\u26a1", "breaker", "[#b8bb26]\u25cf ok[/]"))
+        key = (pnl, daily, spread_pnl, rebates, fills, orders, rejects, cancels,
+               fr, lat, bool(cb), consec, max_loss, rem, reason, inv_rows,
+               _signs(pnl, daily, spread_pnl, rebates, fr, lat, max_loss, rem,
+                      *[size for _, _, size in inv_rows]))
+        if key == self._last_key:
+            return
+        self._last_key = key
 
-        lines.append(
-            _kv("\u2620", "streak ", f"{consec}[#928374]/5[/]  {_bar(consec, 5, 5)}")
-        )
-        lines.append("")
+        pnl_up, daily_up, fr_grade, lat_grade = _frame_codes(pnl, daily, fr, lat)
+        pc, pnl_icon = _SIGN_STYLES[pnl_up]
+        dc, daily_icon = _SIGN_STYLES[daily_up]
+        fc = _GRADE_COLORS[fr_grade]
+        lc = _GRADE_COLORS[lat_grade]
 
+        if cb:
+            breaker = _BREAKER_TRIPPED_FMT(rem) + "\n" + _BREAKER_REASON_FMT(reason)
+        else:
+            breaker = _BREAKER_OK
         loss_used = abs(min(daily, 0))
-        lines.append(
-            _kv("\u25c6", "daily  ",
-                f"{_bar(loss_used, max_loss, 8)} [#928374]${loss_used:.1f}/${max_loss:.0f}[/]")
-        )
 
-        if inventory:
-            lines.append("")
-            lines.append("  [bold #83a598]inventory[/]")
-            for row in inventory[:6]:
-                lines.append(
-                    f"  [#928374]{row.get('condition_id','')[:6]}[/] "
-                    f"{row.get('outcome',''):<3} "
-                    f"[#83a598]{row.get('size',0):+.1f}[/]"
-                )
-
-        self.query_one("#risk-body", Static).update("\n".join(lines))
+        text = "\n".join((
+            _PNL_LINE_FMT(pc, pnl_icon, pnl),
+            _DAILY_LINE_FMT(dc, daily_icon, daily),
+            _SPREAD_LINE_FMT(spread_pnl),
+            _REBATES_LINE_FMT(rebates),
+            _SEP_LINE,
+            _ORDERS_FMT(orders),
+            _FILLS_FMT(fills, rejects, cancels),
+            _RATE_FMT(fc, fr, _bar(fr, 100, 8)),
+            _LAT_FMT(lc, lat),
+            _SEP_LINE,
+            breaker,
+            _STREAK_FMT(consec, _streak_bar(consec)),
+            "",
+            _DAILY_LOSS_FMT(_bar(loss_used, max_loss, 8), loss_used, max_loss),
+        ))
+
+        if inv_rows:
+            text = "\n".join((
+                text, "", _INVENTORY_HEADER,
+                *[_inv_row(cid[:6], outcome, size, copysign(1.0, size))
+                  for cid, outcome, size in inv_rows],
+            ))
+
+        self._body.update(text)